@@ -39,6 +39,8 @@ class FutureGenerationRuntimeConfig(BaseModel):
     default_time_horizon: str
     default_time_horizons_by_depth: dict[int, str]
     mood_fallback_chains: dict[str, list[str]]
+    # Reuse identical generation responses for this long; 0 disables the cache.
+    response_cache_ttl_seconds: int = Field(default=0, ge=0)
 
     @model_validator(mode="after")
     def _validate_counts(self) -> FutureGenerationRuntimeConfig:
@@ -89,6 +91,8 @@ class ServerRuntimeConfig(BaseModel):
 
 class StorageRuntimeConfig(BaseModel):
     path: str
+    # Kept outside the sessions tree so it is never mistaken for a session.
+    llm_cache_path: str = "./storage/.llm_cache"
 
 
 class ConversationMemoryRuntimeConfig(BaseModel):
@@ -107,6 +111,8 @@ class MemoryExtractionRuntimeConfig(BaseModel):
     timeout_seconds: float = Field(gt=0)
     max_messages_for_analysis: int = Field(ge=2)
     input_roles: list[str]
+    # Reuse identical extraction responses for this long; 0 disables the cache.
+    response_cache_ttl_seconds: int = Field(default=0, ge=0)
 
     @model_validator(mode="after")
     def _validate_input_roles(self) -> MemoryExtractionRuntimeConfig:
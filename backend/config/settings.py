@@ -76,6 +76,7 @@ class Settings(BaseSettings):
     # Storage
     # ------------------------------------------------------------------
     storage_path: str = _runtime.storage.path
+    llm_cache_path: str = _runtime.storage.llm_cache_path
 
     @property
     def storage_root(self) -> str:
@@ -88,6 +89,7 @@ class Settings(BaseSettings):
 
     def model_post_init(self, __context: object) -> None:
         self.storage_path = _resolve_storage_path(self.storage_path)
+        self.llm_cache_path = _resolve_storage_path(self.llm_cache_path)
 
     model_config = {
         "env_file": str(_PROJECT_ROOT / ".env"),
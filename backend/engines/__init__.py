@@ -4,6 +4,9 @@ from .context_resolver import ContextResolver, ContextResolutionError, ResolvedC
 from .conversation_memory import (
     analyze_and_persist_transcript_insights,
     append_conversation_turn,
+    append_conversation_turns,
+    extract_transcript_insights,
+    persist_transcript_insights,
 )
 from .conversation_session import BranchConversationSession
 from .current_self_auto_generator import (
@@ -29,7 +32,10 @@ __all__ = [
     "ContextResolutionError",
     "ResolvedConversationContext",
     "append_conversation_turn",
+    "append_conversation_turns",
     "analyze_and_persist_transcript_insights",
+    "extract_transcript_insights",
+    "persist_transcript_insights",
     "PromptComposer",
     "PromptComposerConfig",
     "MistralChatClient",
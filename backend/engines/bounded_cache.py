@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+# Small in-process LRU for per-session memo tables that live as long as the
+# server. Sessions are never "closed" explicitly, so anything keyed by session
+# id must be capped or it grows with every session ever touched. Safe to use
+# from request handlers and asyncio.to_thread workers alike.
+
+
+class BoundedCache:
+    """Mapping of at most ``maxsize`` entries; the least recently used is evicted."""
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def __len__(self) -> int:
+        return len(self._data)
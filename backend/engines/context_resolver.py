@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from backend.config.runtime import get_runtime_config
 
+from .json_io import iter_node_files, load_json_bytes
+
 JsonDict = dict[str, Any]
 _runtime = get_runtime_config()
 
@@ -120,12 +121,11 @@ class ContextResolver:
         nodes_dir = session_dir / "memory" / "nodes"
         nodes_by_id: dict[str, JsonDict] = {}
 
-        if nodes_dir.exists():
-            for path in sorted(nodes_dir.glob("*.json")):
-                node = self._load_required_json(path)
-                node_id = node.get("id")
-                if isinstance(node_id, str):
-                    nodes_by_id[node_id] = node
+        for node_file in sorted(iter_node_files(nodes_dir)):
+            node = self._load_required_json(node_file)
+            node_id = node.get("id")
+            if isinstance(node_id, str):
+                nodes_by_id[node_id] = node
 
         if nodes_by_id:
             return nodes_by_id
@@ -235,8 +235,7 @@ class ContextResolver:
     def _load_required_json(self, path: Path) -> Any:
         if not path.exists():
             raise ContextResolutionError(f"Missing file: {path}")
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_bytes(path.read_bytes())
         if not isinstance(data, dict) and not isinstance(data, list):
             raise ContextResolutionError(f"Invalid JSON object in {path}")
         return data
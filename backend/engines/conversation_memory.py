@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import re
 import time
-import uuid
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from backend.config.runtime import get_runtime_config
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # Optional: transcripts are loaded whole when unavailable.
+
+from .json_io import load_json_bytes, write_json_atomic
+from .llm_cache import cache_key, read_cached_response, write_cached_response
 from .mistral_client import MistralChatClient, MistralChatConfig
 
 _runtime = get_runtime_config()
 _memory_cfg = _runtime.conversation_memory
 _extract_cfg = _runtime.memory_extraction
 
+# Bump when the extraction prompt changes so cached responses are not reused.
+_INSIGHTS_PROMPT_VERSION = "insights-v1"
+_MIN_ANALYSIS_CONTENT_CHARS = 40
+
+# Insight-derived facts, notes and transcript entries are tagged so reruns can
+# replace them without parsing note text.
+_INSIGHT_SOURCE = "transcript_analysis"
+_INSIGHT_NOTES_KEY = "transcriptAnalysisNotes"
+_INSIGHT_NOTE_PREFIX = "Transcript insight ["
+
 
 def append_conversation_turn(
     *,
@@ -29,18 +49,68 @@ def append_conversation_turn(
     """
     Persist one conversation turn (user + assistant) to transcript.json.
     """
-    if not _memory_cfg.enabled:
-        return
+    append_conversation_turns(
+        session_id=session_id,
+        storage_root=storage_root,
+        branch_name=branch_name,
+        self_id=self_id,
+        self_name=self_name,
+        turns=[(user_text, assistant_text)],
+    )
 
-    cleaned_user = user_text.strip()
-    cleaned_assistant = assistant_text.strip()
-    if not cleaned_user or not cleaned_assistant:
+
+def append_conversation_turns(
+    *,
+    session_id: str,
+    storage_root: str | Path,
+    branch_name: str,
+    self_id: str | None,
+    self_name: str | None,
+    turns: Iterable[tuple[str, str]],
+) -> None:
+    """
+    Persist several (user_text, assistant_text) turns with one transcript read and write.
+    """
+    if not _memory_cfg.enabled:
         return
 
     session_dir = Path(storage_root) / session_id
     transcript_path = session_dir / "transcript.json"
     transcript = _load_json_list(transcript_path)
 
+    now = time.time()
+    appended = False
+    for user_text, assistant_text in turns:
+        appended |= _append_turn_pair(
+            transcript,
+            branch_name=branch_name,
+            self_id=self_id,
+            self_name=self_name,
+            user_text=user_text,
+            assistant_text=assistant_text,
+            timestamp=now,
+        )
+    if not appended:
+        return
+    _trim_transcript(transcript)
+    write_json_atomic(transcript_path, transcript)
+
+
+def _append_turn_pair(
+    transcript: list,
+    *,
+    branch_name: str,
+    self_id: str | None,
+    self_name: str | None,
+    user_text: str,
+    assistant_text: str,
+    timestamp: float,
+) -> bool:
+    cleaned_user = user_text.strip()
+    cleaned_assistant = assistant_text.strip()
+    if not cleaned_user or not cleaned_assistant:
+        return False
+
     # Idempotency guard: skip duplicate final pair.
     if len(transcript) >= 2:
         last_user = transcript[-2]
@@ -59,9 +129,8 @@ def append_conversation_turn(
             and last_user.get("branchName") == branch_name
             and last_assistant.get("branchName") == branch_name
         ):
-            return
+            return False
 
-    now = time.time()
     entries = [
         _new_transcript_entry(
             role="user",
@@ -69,7 +138,7 @@ def append_conversation_turn(
             branch_name=branch_name,
             self_id=self_id,
             self_name=self_name,
-            timestamp=now,
+            timestamp=timestamp,
         ),
         _new_transcript_entry(
             role="assistant",
@@ -77,13 +146,11 @@ def append_conversation_turn(
             branch_name=branch_name,
             self_id=self_id,
             self_name=self_name,
-            timestamp=now,
+            timestamp=timestamp,
         ),
     ]
     _append_transcript_entries(transcript, entries)
-    _trim_transcript(transcript)
-    transcript_path.parent.mkdir(parents=True, exist_ok=True)
-    transcript_path.write_text(json.dumps(transcript, indent=2), encoding="utf-8")
+    return True
 
 
 def analyze_and_persist_transcript_insights(
@@ -94,73 +161,254 @@ def analyze_and_persist_transcript_insights(
     self_id: str | None,
     self_name: str | None,
     api_key: str,
+    cache_dir: str | Path | None = None,
 ) -> list[dict[str, str]]:
     """
     Analyze branch transcript with LLM and persist extracted insights to:
     - transcript.json (role=memory)
     - current branch memory node (facts + notes)
+
+    When cache_dir is given and memory_extraction.response_cache_ttl_seconds
+    is positive, LLM responses are reused for byte-identical transcript slices
+    instead of calling the model again. Callers that need to serialize session
+    writes can run the two halves separately via extract_transcript_insights
+    and persist_transcript_insights.
     """
-    if not _memory_cfg.enabled or not _extract_cfg.enabled:
+    insights = extract_transcript_insights(
+        session_id=session_id,
+        storage_root=storage_root,
+        branch_name=branch_name,
+        self_id=self_id,
+        api_key=api_key,
+        cache_dir=cache_dir,
+    )
+    if insights is None:
         return []
+    return persist_transcript_insights(
+        session_id=session_id,
+        storage_root=storage_root,
+        branch_name=branch_name,
+        self_id=self_id,
+        self_name=self_name,
+        insights=insights,
+    )
+
+
+def extract_transcript_insights(
+    *,
+    session_id: str,
+    storage_root: str | Path,
+    branch_name: str,
+    self_id: str | None,
+    api_key: str,
+    cache_dir: str | Path | None = None,
+) -> list[dict[str, str]] | None:
+    """
+    Run the LLM insight extraction for a branch without writing anything.
+
+    Returns None when extraction is disabled or no API key is configured, in
+    which case nothing should be persisted.
+    """
+    if not _memory_cfg.enabled or not _extract_cfg.enabled:
+        return None
 
     if not api_key.strip():
-        return []
+        return None
 
-    session_dir = Path(storage_root) / session_id
-    transcript_path = session_dir / "transcript.json"
-    convo_entries = _select_branch_conversation_entries(
-        transcript=_load_json_list(transcript_path),
+    return _extract_branch_insights(
+        transcript_path=Path(storage_root) / session_id / "transcript.json",
         branch_name=branch_name,
         self_id=self_id,
+        api_key=api_key,
+        cache_dir=Path(cache_dir) if cache_dir is not None else None,
     )
-    insights: list[dict[str, str]] = []
-    if convo_entries:
-        clipped_entries = convo_entries[-_extract_cfg.max_messages_for_analysis :]
-        raw_output = _extract_insights_with_llm(clipped_entries, api_key=api_key)
-        insights = _parse_insights(raw_output)
 
-    now = time.time()
+
+def persist_transcript_insights(
+    *,
+    session_id: str,
+    storage_root: str | Path,
+    branch_name: str,
+    self_id: str | None,
+    self_name: str | None,
+    insights: list[dict[str, str]],
+) -> list[dict[str, str]]:
+    """
+    Write extracted insights to the branch memory node, session.json and
+    transcript.json. Returns the insights that were added.
+    """
     return _persist_insights(
-        session_dir=session_dir,
+        session_dir=Path(storage_root) / session_id,
         branch_name=branch_name,
         self_id=self_id,
         self_name=self_name,
         insights=insights,
-        timestamp=now,
+        timestamp=time.time(),
     )
 
 
-def _select_branch_conversation_entries(
+def _extract_branch_insights(
     *,
-    transcript: list,
+    transcript_path: Path,
     branch_name: str,
     self_id: str | None,
+    api_key: str,
+    cache_dir: Path | None,
 ) -> list[dict[str, str]]:
-    allowed_roles = {
-        role for role in _extract_cfg.input_roles if role in {"user", "assistant"}
-    } or {"user", "assistant"}
-    selected: list[dict[str, str]] = []
-    for raw in transcript:
-        if not isinstance(raw, dict):
-            continue
-        if raw.get("phase") != "conversation":
-            continue
-        role = str(raw.get("role") or "").strip().lower()
-        if role not in allowed_roles:
-            continue
+    convo_entries = _select_branch_conversation_entries(
+        transcript=_branch_conversation_candidates(transcript_path, branch_name),
+        branch_name=branch_name,
+        self_id=self_id,
+    )
+    clipped_entries = convo_entries[-_extract_cfg.max_messages_for_analysis :]
+    # Too little text to ground any insight; skip the LLM round-trip.
+    if sum(len(entry["content"]) for entry in clipped_entries) < _MIN_ANALYSIS_CONTENT_CHARS:
+        return []
+    raw_output = _extract_insights_cached(
+        clipped_entries,
+        api_key=api_key,
+        cache_dir=cache_dir,
+    )
+    return _parse_insights(raw_output)
 
-        entry_branch = raw.get("branchName")
-        entry_self = raw.get("selfId")
-        if branch_name and entry_branch and entry_branch != branch_name:
-            continue
-        if self_id and entry_self and entry_self != self_id:
-            continue
 
-        content = raw.get("content")
-        if not isinstance(content, str) or not content.strip():
+def _iter_transcript_entries(path: Path) -> Iterator[Any]:
+    """Yield top-level transcript items without materializing the whole list when ijson is available."""
+    if not path.exists():
+        return
+    if ijson is None:
+        yield from _load_json_list(path)
+        return
+    with path.open("rb") as f:
+        # use_float keeps timestamps as float rather than Decimal.
+        yield from ijson.items(f, "item", use_float=True)
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptEntry:
+    """Conversation-phase transcript entry, normalized once when the transcript is indexed."""
+
+    role: str
+    content: str
+    branch_name: str | None
+    self_id: str | None
+
+
+def _coerce_transcript_entry(raw: Any) -> TranscriptEntry | None:
+    if not isinstance(raw, dict) or raw.get("phase") != "conversation":
+        return None
+    content = raw.get("content")
+    if not isinstance(content, str) or not content.strip():
+        return None
+    return TranscriptEntry(
+        role=str(raw.get("role") or "").strip().lower(),
+        content=content.strip(),
+        branch_name=raw.get("branchName") or None,
+        self_id=raw.get("selfId") or None,
+    )
+
+
+def _branch_conversation_candidates(
+    transcript_path: Path, branch_name: str
+) -> list[TranscriptEntry]:
+    """Conversation-phase entries that can match branch_name, in transcript order."""
+    try:
+        stat = os.stat(transcript_path)
+    except FileNotFoundError:
+        return []
+    all_entries, by_branch = _transcript_branch_index(
+        str(transcript_path), stat.st_mtime_ns, stat.st_size
+    )
+    if not branch_name:
+        return [entry for _, entry in all_entries]
+    # Entries without a branchName match every branch; keep them interleaved in order.
+    merged = heapq.merge(
+        by_branch.get(branch_name, ()),
+        by_branch.get(None, ()),
+        key=lambda item: item[0],
+    )
+    return [entry for _, entry in merged]
+
+
+@lru_cache(maxsize=32)
+def _transcript_branch_index(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[
+    list[tuple[int, TranscriptEntry]],
+    dict[str | None, list[tuple[int, TranscriptEntry]]],
+]:
+    # Built once per transcript version so per-branch backfills skip full rescans.
+    all_entries: list[tuple[int, TranscriptEntry]] = []
+    by_branch: dict[str | None, list[tuple[int, TranscriptEntry]]] = {}
+    for pos, raw in enumerate(_iter_transcript_entries(Path(path_str))):
+        entry = _coerce_transcript_entry(raw)
+        if entry is None:
             continue
-        selected.append({"role": role, "content": content.strip()})
-    return selected
+        item = (pos, entry)
+        all_entries.append(item)
+        by_branch.setdefault(entry.branch_name, []).append(item)
+    return all_entries, by_branch
+
+
+def _select_branch_conversation_entries(
+    *,
+    transcript: Iterable[TranscriptEntry],
+    branch_name: str,
+    self_id: str | None,
+) -> list[dict[str, str]]:
+    allowed_roles = _allowed_input_roles(tuple(_extract_cfg.input_roles))
+    # Falsy filters (and entries missing branch/self) match everything.
+    branch_filter = branch_name or None
+    self_filter = self_id or None
+    return [
+        {"role": entry.role, "content": entry.content}
+        for entry in transcript
+        if entry.role in allowed_roles
+        and (branch_filter is None or entry.branch_name in (None, branch_filter))
+        and (self_filter is None or entry.self_id in (None, self_filter))
+    ]
+
+
+@lru_cache(maxsize=8)
+def _allowed_input_roles(input_roles: tuple[str, ...]) -> frozenset[str]:
+    # Keyed by the configured roles so runtime overrides still apply.
+    return frozenset(
+        role for role in input_roles if role in {"user", "assistant"}
+    ) or frozenset({"user", "assistant"})
+
+
+def _extract_insights_cached(
+    entries: list[dict[str, str]],
+    *,
+    api_key: str,
+    cache_dir: Path | None,
+) -> str:
+    if cache_dir is None or _extract_cfg.response_cache_ttl_seconds <= 0:
+        return _extract_insights_with_llm(entries, api_key=api_key)
+
+    cache_path = cache_dir / f"{_insights_cache_key(entries)}.json"
+    cached = read_cached_response(cache_path, version=_INSIGHTS_PROMPT_VERSION)
+    if cached is not None:
+        return cached
+
+    raw_output = _extract_insights_with_llm(entries, api_key=api_key)
+    write_cached_response(
+        cache_path,
+        raw_output,
+        version=_INSIGHTS_PROMPT_VERSION,
+        ttl_seconds=_extract_cfg.response_cache_ttl_seconds,
+    )
+    return raw_output
+
+
+def _insights_cache_key(entries: list[dict[str, str]]) -> str:
+    return cache_key(
+        _INSIGHTS_PROMPT_VERSION,
+        _extract_cfg.model,
+        json.dumps(entries, sort_keys=True, ensure_ascii=False),
+    )
 
 
 def _extract_insights_with_llm(entries: list[dict[str, str]], *, api_key: str) -> str:
@@ -257,38 +505,81 @@ def _persist_insights(
     insights: list[dict[str, str]],
     timestamp: float,
 ) -> list[dict[str, str]]:
-    head_node_id = _resolve_branch_head_node_id(session_dir=session_dir, branch_name=branch_name)
-    if not head_node_id:
+    applied = _apply_insights_to_node(
+        session_dir=session_dir,
+        head_node_id=_branch_head_index(session_dir).get(branch_name),
+        branch_name=branch_name,
+        self_id=self_id,
+        self_name=self_name,
+        insights=insights,
+        timestamp=timestamp,
+    )
+    if applied is None:
         return []
+    node, added, memory_entries = applied
+    _sync_session_memory_nodes(session_dir=session_dir, nodes=[node])
+
+    transcript_path = session_dir / "transcript.json"
+    transcript = _replace_branch_memory_entries(
+        transcript=_load_json_list(transcript_path),
+        branch_name=branch_name,
+        self_id=self_id,
+        memory_entries=memory_entries,
+    )
+    _trim_transcript(transcript)
+    write_json_atomic(transcript_path, transcript)
+    return added
+
+
+def _apply_insights_to_node(
+    *,
+    session_dir: Path,
+    head_node_id: str | None,
+    branch_name: str,
+    self_id: str | None,
+    self_name: str | None,
+    insights: list[dict[str, str]],
+    timestamp: float,
+) -> tuple[dict, list[dict[str, str]], list[dict[str, Any]]] | None:
+    """Replace prior insights on the branch head node and write it; returns None if there is no head node."""
+    if not head_node_id:
+        return None
 
     node_path = session_dir / "memory" / "nodes" / f"{head_node_id}.json"
     node = _load_json_dict(node_path)
     if not node:
-        return []
+        return None
 
     notes_all = list(node.get("notes") or [])
     facts_all = list(node.get("facts") or [])
-    notes = [
-        n
-        for n in notes_all
-        if not (isinstance(n, str) and n.startswith("Transcript insight ["))
-    ]
+    prior_insight_notes = node.get(_INSIGHT_NOTES_KEY)
+    if isinstance(prior_insight_notes, list):
+        stale_notes = set(prior_insight_notes)
+        notes = [n for n in notes_all if n not in stale_notes]
+    else:
+        # Nodes written before insight notes were tracked by key.
+        notes = [
+            n
+            for n in notes_all
+            if not (isinstance(n, str) and n.startswith(_INSIGHT_NOTE_PREFIX))
+        ]
     facts = [
         f
         for f in facts_all
-        if not (isinstance(f, dict) and f.get("source") == "transcript_analysis")
+        if not (isinstance(f, dict) and f.get("source") == _INSIGHT_SOURCE)
     ]
 
     added: list[dict[str, str]] = []
+    insight_notes: list[str] = []
     memory_entries: list[dict[str, Any]] = []
     for insight in insights:
         added.append(insight)
 
         fact_entry: dict[str, Any] = {
-            "id": f"fact_{uuid.uuid4().hex[:12]}",
+            "id": f"fact_{_short_id()}",
             "fact": insight["element"],
             "type": insight["type"],
-            "source": "transcript_analysis",
+            "source": _INSIGHT_SOURCE,
             "branchName": branch_name,
             "selfId": self_id,
             "extractedAt": timestamp,
@@ -299,29 +590,37 @@ def _persist_insights(
             fact_entry["whyItMatters"] = insight["why_it_matters"]
         facts.append(fact_entry)
 
-        note = f"Transcript insight [{insight['type']}]: {insight['element']}"
+        note = f"{_INSIGHT_NOTE_PREFIX}{insight['type']}]: {insight['element']}"
         if note not in notes:
             notes.append(note)
+            insight_notes.append(note)
 
-        memory_entries.append(
-            _new_transcript_entry(
-                role="memory",
-                content=note,
-                branch_name=branch_name,
-                self_id=self_id,
-                self_name=self_name,
-                timestamp=timestamp,
-            )
+        memory_entry = _new_transcript_entry(
+            role="memory",
+            content=note,
+            branch_name=branch_name,
+            self_id=self_id,
+            self_name=self_name,
+            timestamp=timestamp,
         )
+        memory_entry["source"] = _INSIGHT_SOURCE
+        memory_entries.append(memory_entry)
 
     node["notes"] = notes[-_memory_cfg.max_notes_per_node :]
+    kept_notes = set(node["notes"])
+    node[_INSIGHT_NOTES_KEY] = [n for n in insight_notes if n in kept_notes]
     node["facts"] = facts[-_memory_cfg.max_facts_per_node :]
-    node_path.parent.mkdir(parents=True, exist_ok=True)
-    node_path.write_text(json.dumps(node, indent=2), encoding="utf-8")
-    _sync_session_memory_nodes(session_dir=session_dir, node=node)
+    write_json_atomic(node_path, node)
+    return node, added, memory_entries
 
-    transcript_path = session_dir / "transcript.json"
-    transcript = _load_json_list(transcript_path)
+
+def _replace_branch_memory_entries(
+    *,
+    transcript: list,
+    branch_name: str,
+    self_id: str | None,
+    memory_entries: list[dict[str, Any]],
+) -> list:
     transcript = _drop_prior_branch_memory_entries(
         transcript=transcript,
         branch_name=branch_name,
@@ -329,11 +628,7 @@ def _persist_insights(
     )
     for entry in memory_entries:
         _append_transcript_entries(transcript, [entry])
-    _trim_transcript(transcript)
-    transcript_path.parent.mkdir(parents=True, exist_ok=True)
-    transcript_path.write_text(json.dumps(transcript, indent=2), encoding="utf-8")
-
-    return added
+    return transcript
 
 
 def _drop_prior_branch_memory_entries(
@@ -351,8 +646,13 @@ def _drop_prior_branch_memory_entries(
             cleaned.append(raw)
             continue
 
-        content = raw.get("content")
-        if not isinstance(content, str) or not content.startswith("Transcript insight ["):
+        source = raw.get("source")
+        if source is None:
+            # Entries written before memory entries carried a source tag.
+            content = raw.get("content")
+            if isinstance(content, str) and content.startswith(_INSIGHT_NOTE_PREFIX):
+                source = _INSIGHT_SOURCE
+        if source != _INSIGHT_SOURCE:
             cleaned.append(raw)
             continue
         if raw.get("branchName") != branch_name:
@@ -366,20 +666,20 @@ def _drop_prior_branch_memory_entries(
     return cleaned
 
 
-def _resolve_branch_head_node_id(*, session_dir: Path, branch_name: str) -> str | None:
-    branches_path = session_dir / "memory" / "branches.json"
-    for raw in _load_json_list(branches_path):
+def _branch_head_index(session_dir: Path) -> dict[str, str]:
+    # branch name -> headNodeId in one pass; the first valid entry per name wins.
+    heads: dict[str, str] = {}
+    for raw in _load_json_list(session_dir / "memory" / "branches.json"):
         if not isinstance(raw, dict):
             continue
-        if raw.get("name") != branch_name:
-            continue
+        name = raw.get("name")
         head = raw.get("headNodeId")
-        if isinstance(head, str) and head:
-            return head
-    return None
+        if isinstance(name, str) and isinstance(head, str) and head:
+            heads.setdefault(name, head)
+    return heads
 
 
-def _sync_session_memory_nodes(*, session_dir: Path, node: dict) -> None:
+def _sync_session_memory_nodes(*, session_dir: Path, nodes: list[dict]) -> None:
     session_path = session_dir / "session.json"
     session = _load_json_dict(session_path)
     if not session:
@@ -388,20 +688,32 @@ def _sync_session_memory_nodes(*, session_dir: Path, node: dict) -> None:
     if not isinstance(memory_nodes, list):
         return
 
-    node_id = node.get("id")
-    if not isinstance(node_id, str) or not node_id:
-        return
-
-    replaced = False
-    for idx, raw in enumerate(memory_nodes):
-        if isinstance(raw, dict) and raw.get("id") == node_id:
+    index_by_id = {
+        raw.get("id"): idx
+        for idx, raw in reversed(list(enumerate(memory_nodes)))
+        if isinstance(raw, dict)
+    }
+    changed = False
+    for node in nodes:
+        node_id = node.get("id")
+        if not isinstance(node_id, str) or not node_id:
+            continue
+        idx = index_by_id.get(node_id)
+        if idx is not None:
             memory_nodes[idx] = node
-            replaced = True
-            break
-    if not replaced:
-        memory_nodes.append(node)
+        else:
+            index_by_id[node_id] = len(memory_nodes)
+            memory_nodes.append(node)
+        changed = True
+    if not changed:
+        return
     session["memoryNodes"] = memory_nodes
-    session_path.write_text(json.dumps(session, indent=2), encoding="utf-8")
+    write_json_atomic(session_path, session)
+
+
+def _short_id(hex_chars: int = 12) -> str:
+    # Same entropy source as uuid4().hex[:n], without building the UUID and its 32-char string.
+    return os.urandom(hex_chars // 2).hex()
 
 
 def _insight_key(type_value: str, element_value: str) -> str:
@@ -418,7 +730,7 @@ def _new_transcript_entry(
     timestamp: float,
 ) -> dict[str, Any]:
     return {
-        "id": f"te_{uuid.uuid4().hex[:12]}",
+        "id": f"te_{_short_id()}",
         "turn": 0,
         "phase": "conversation",
         "role": role,
@@ -499,8 +811,7 @@ def _dedupe_insights(items: list[dict[str, str]]) -> list[dict[str, str]]:
 def _load_json_list(path: Path) -> list:
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = load_json_bytes(path.read_bytes())
     if isinstance(raw, list):
         return raw
     return []
@@ -509,8 +820,7 @@ def _load_json_list(path: Path) -> list:
 def _load_json_dict(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = load_json_bytes(path.read_bytes())
     if isinstance(raw, dict):
         return raw
     return {}
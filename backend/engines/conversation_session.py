@@ -21,16 +21,24 @@ class BranchConversationSession:
     composer: PromptComposer
     client: ChatBackendProtocol
     history: list[ChatMessage] = field(default_factory=list)
+    _system_prompt: str | None = field(default=None, init=False, repr=False)
 
     def reset(self) -> None:
         self.history.clear()
 
-    def reply(self, user_message: str) -> str:
-        messages = self.composer.compose_messages(
+    def _compose(self, user_message: str) -> list[ChatMessage]:
+        # The context is fixed for the session, so its system prompt is built once.
+        if self._system_prompt is None:
+            self._system_prompt = self.composer.compose_system_prompt(self.context)
+        return self.composer.compose_messages(
             context=self.context,
             user_message=user_message,
             history=self.history,
+            system_prompt=self._system_prompt,
         )
+
+    def reply(self, user_message: str) -> str:
+        messages = self._compose(user_message)
         assistant_text = self.client.chat(messages).strip()
         if not assistant_text:
             raise RuntimeError("Received empty assistant response")
@@ -38,11 +46,7 @@ class BranchConversationSession:
         return assistant_text
 
     def stream_reply(self, user_message: str) -> Iterator[str]:
-        messages = self.composer.compose_messages(
-            context=self.context,
-            user_message=user_message,
-            history=self.history,
-        )
+        messages = self._compose(user_message)
 
         user_text = user_message.strip()
         chunks: list[str] = []
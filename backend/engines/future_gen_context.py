@@ -9,11 +9,14 @@ This feeds into GenerationContext so deeper generations get richer context.
 """
 from __future__ import annotations
 
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from backend.config.runtime import get_runtime_config
 
+from .json_io import iter_node_files, load_json_bytes
+
 _runtime_fg_ctx = get_runtime_config().future_generation_context
 
 # ---------------------------------------------------------------------------
@@ -47,34 +50,25 @@ def resolve_ancestor_context(
     session_dir = Path(storage_path) / session_id
     nodes_dir = session_dir / "memory" / "nodes"
 
-    # --- Build lookup tables ---
-    nodes_by_self_id: dict[str, dict] = {}
-    nodes_by_id: dict[str, dict] = {}
-    for node_file in nodes_dir.glob("*.json"):
-        node = json.loads(node_file.read_text(encoding="utf-8"))
-        nodes_by_id[node["id"]] = node
-        self_card = node.get("selfCard")
-        if self_card:
-            nodes_by_id[node["id"]] = node
-            sid = self_card.get("id")
-            if sid:
-                nodes_by_self_id[sid] = node
-
-    # --- Walk from parent to root ---
+    # --- Walk from parent to root, loading only nodes on the ancestor path ---
     ancestor_chain: list[dict] = []  # oldest → newest
     visited: set[str] = set()
 
-    current_node = nodes_by_self_id.get(parent_self_id)
-    while current_node and current_node["id"] not in visited:
+    start_node = _find_node_for_self(nodes_dir, parent_self_id)
+    stack: list[dict] = [start_node] if start_node else []
+    while stack:
+        current_node = stack.pop()
+        if current_node["id"] in visited:
+            continue  # malformed cyclic parent links
         visited.add(current_node["id"])
         self_card = current_node.get("selfCard")
         if self_card:
             ancestor_chain.append(self_card)
         parent_id = current_node.get("parentId")
-        if parent_id and parent_id in nodes_by_id:
-            current_node = nodes_by_id[parent_id]
-        else:
-            break
+        if parent_id:
+            parent_node = _load_node(nodes_dir, parent_id)
+            if parent_node:
+                stack.append(parent_node)
 
     # Reverse to get oldest-first (root→parent)
     ancestor_chain.reverse()
@@ -100,49 +94,48 @@ def resolve_ancestor_context(
             if isinstance(role, str) and role.strip()
         } or {"user", "assistant", "memory"}
 
-        transcript: list[dict] = json.loads(
-            transcript_file.read_text(encoding="utf-8")
-        )
+        transcript: list[dict] = load_json_bytes(transcript_file.read_bytes())
         # Gather names of ancestors for filtering
         ancestor_names = {
             card.get("name") for card in ancestor_chain if card.get("name")
         }
 
-        # Filter to conversation-phase entries involving ancestors
-        convo_entries = [
-            entry
-            for entry in transcript
-            if entry.get("phase") == "conversation"
-            and entry.get("selfName") in ancestor_names
-            and str(entry.get("role", "")).strip().lower() in allowed_roles
-        ]
+        # Filter to conversation-phase entries involving ancestors, normalizing
+        # each matching entry once to (role, selfName, content).
+        convo_entries: list[tuple[str, str, str]] = []
+        for entry in transcript:
+            if entry.get("phase") != "conversation":
+                continue
+            name = entry.get("selfName")
+            if name not in ancestor_names:
+                continue
+            role = str(entry.get("role", "")).strip().lower()
+            if role in allowed_roles:
+                convo_entries.append((role, name, entry.get("content", "")))
 
         # Take most recent entries, grouped by ancestor.
         # Pass 1 prefers user/assistant turns so narrative context is not crowded out
         # by transcript-memory entries. Pass 2 backfills remaining slots.
         seen_per_ancestor: dict[str, int] = {}
-        selected_ids: set[int] = set()
+        selected_positions: set[int] = set()
         preferred_roles = {"user", "assistant"} & allowed_roles
 
         def _collect_pass(*, roles: set[str] | None) -> None:
-            for entry in reversed(convo_entries):
+            for pos in range(len(convo_entries) - 1, -1, -1):
                 if len(conversation_excerpts) >= max_total_excerpts:
                     break
-                entry_id = id(entry)
-                if entry_id in selected_ids:
+                if pos in selected_positions:
                     continue
-                role = str(entry.get("role", "?")).strip().lower()
+                role, name, content = convo_entries[pos]
                 if roles is not None and role not in roles:
                     continue
 
-                name = entry.get("selfName", "")
-                seen_per_ancestor.setdefault(name, 0)
-                if seen_per_ancestor[name] >= max_conversation_excerpts_per_ancestor:
+                seen = seen_per_ancestor.get(name, 0)
+                if seen >= max_conversation_excerpts_per_ancestor:
                     continue
-                content = entry.get("content", "")
                 conversation_excerpts.append(f"[{role} ↔ {name}]: {content}")
-                seen_per_ancestor[name] += 1
-                selected_ids.add(entry_id)
+                seen_per_ancestor[name] = seen + 1
+                selected_positions.add(pos)
 
         if preferred_roles:
             _collect_pass(roles=preferred_roles)
@@ -154,6 +147,34 @@ def resolve_ancestor_context(
     return ancestor_summary, conversation_excerpts
 
 
+def _find_node_for_self(nodes_dir: Path, self_id: str) -> dict | None:
+    for node_file in iter_node_files(nodes_dir):
+        node = _read_node_file(node_file)
+        if node and (node.get("selfCard") or {}).get("id") == self_id:
+            return node
+    return None
+
+
+def _load_node(nodes_dir: Path, node_id: str) -> dict | None:
+    # Node files are written as <node id>.json by the memory tree writers.
+    return _read_node_file(nodes_dir / f"{node_id}.json")
+
+
+def _read_node_file(node_file: Path) -> dict | None:
+    try:
+        mtime_ns = os.stat(node_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_node_cached(str(node_file), mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _load_node_cached(path_str: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the key so rewritten nodes are re-read.
+    # Returned dicts are shared between callers and must be treated as read-only.
+    return load_json_bytes(Path(path_str).read_bytes())
+
+
 def collect_sibling_names(
     session_data: dict,
     parent_key: str,
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import uuid
+import weakref
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from mistralai import Mistral
 
@@ -16,8 +20,33 @@ from backend.models.schemas import (
     VisualStyle,
 )
 
+from .llm_cache import cache_key, read_cached_response, write_cached_response
+
 _runtime_fg = get_runtime_config().future_generation
 
+# Bump when the generation prompt or schema changes so cached responses are not reused.
+_GENERATION_PROMPT_VERSION = "future-selves-v1"
+
+# SDK clients keyed by event loop. The async HTTP pool is tied to the loop it
+# first ran on, so clients are shared within a loop (keep-alive connections
+# survive across generations) but never across asyncio.run() calls.
+_clients_by_loop: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[str, Mistral]
+] = weakref.WeakKeyDictionary()
+
+
+def _mistral_client(api_key: str) -> Mistral:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return Mistral(api_key=api_key)
+    cached = _clients_by_loop.get(loop)
+    if cached is not None and cached[0] == api_key:
+        return cached[1]
+    client = Mistral(api_key=api_key)
+    _clients_by_loop[loop] = (api_key, client)
+    return client
+
 # ---------------------------------------------------------------------------
 # Content-hashed ID generation
 # ---------------------------------------------------------------------------
@@ -163,13 +192,10 @@ FUTURE_SELF_RESPONSE_FORMAT = {
 # Unified prompt template — adapts by depth, injects conversation context
 # ---------------------------------------------------------------------------
 
-_GENERATION_TEMPLATE = """\
-Generate {count} contrasting future self personas for the following person.
-
-{depth_framing}
-
----
-
+# The profile and anchor come first so every generation in a session shares
+# an identical prompt prefix (root and all branches); Mistral's prefix cache
+# can then reuse it and only the depth-specific tail is new per call.
+_PROFILE_PREFIX_TEMPLATE = """\
 USER PROFILE:
 - Core values: {core_values}
 - Fears: {fears}
@@ -182,6 +208,15 @@ USER PROFILE:
 
 {anchor_section}
 
+---
+
+"""
+
+_GENERATION_TEMPLATE = """\
+Generate {count} contrasting future self personas for the person described above.
+
+{depth_framing}
+
 {parent_section}
 
 {ancestor_section}
@@ -267,9 +302,16 @@ class FutureSelfGenerator:
     # Default time horizons by depth (overridable via GenerationContext)
     DEFAULT_TIME_HORIZONS: dict[int, str] = _runtime_fg.default_time_horizons_by_depth
 
-    def __init__(self) -> None:
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
         self.settings = get_settings()
-        self.client = Mistral(api_key=self.settings.mistral_api_key)
+        self.client = _mistral_client(self.settings.mistral_api_key)
+        # Raw responses are cached only when a directory is given and
+        # future_generation.response_cache_ttl_seconds is positive.
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None and _runtime_fg.response_cache_ttl_seconds > 0
+            else None
+        )
 
     # ------------------------------------------------------------------
     # Public API — single entry point for all depths
@@ -292,13 +334,22 @@ class FutureSelfGenerator:
         """
         user_message = self._build_message(ctx)
 
-        response = await self.client.agents.complete_async(
-            agent_id=self.settings.mistral_agent_id_future_self,
-            messages=[{"role": "user", "content": user_message}],
-            response_format=FUTURE_SELF_RESPONSE_FORMAT,  # pyright: ignore[reportArgumentType]
+        cache_path = self._cache_path(user_message)
+        raw_json = (
+            await asyncio.to_thread(
+                read_cached_response, cache_path, version=_GENERATION_PROMPT_VERSION
+            )
+            if cache_path is not None
+            else None
         )
-
-        raw_json = response.choices[0].message.content
+        cached = raw_json is not None
+        if raw_json is None:
+            response = await self.client.agents.complete_async(
+                agent_id=self.settings.mistral_agent_id_future_self,
+                messages=[{"role": "user", "content": user_message}],
+                response_format=FUTURE_SELF_RESPONSE_FORMAT,  # pyright: ignore[reportArgumentType]
+            )
+            raw_json = response.choices[0].message.content
         if not raw_json:
             raise ValueError("Mistral returned an empty response")
 
@@ -310,6 +361,17 @@ class FutureSelfGenerator:
                 f"Raw output: {raw_json[:500]}"
             ) from exc
 
+        # Only schema-valid responses are cached; IDs and voices are still
+        # assigned fresh below, so a cache hit never reuses a SelfCard ID.
+        if cache_path is not None and not cached:
+            await asyncio.to_thread(
+                write_cached_response,
+                cache_path,
+                raw_json,  # pyright: ignore[reportArgumentType]
+                version=_GENERATION_PROMPT_VERSION,
+                ttl_seconds=_runtime_fg.response_cache_ttl_seconds,
+            )
+
         import time as _time
         now = _time.time()
 
@@ -320,14 +382,51 @@ class FutureSelfGenerator:
             timestamp=now,
         )
 
+    def _cache_path(self, user_message: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        key = cache_key(
+            _GENERATION_PROMPT_VERSION,
+            self.settings.mistral_agent_id_future_self,
+            json.dumps(FUTURE_SELF_RESPONSE_FORMAT, sort_keys=True),
+            user_message,
+        )
+        return self.cache_dir / f"{key}.json"
+
     # ------------------------------------------------------------------
     # Prompt builder — single method, conditional sections
     # ------------------------------------------------------------------
 
     def _build_message(self, ctx: GenerationContext) -> str:
-        """Build a depth-aware prompt from the GenerationContext."""
+        """Build a depth-aware prompt: shared profile prefix + per-call tail."""
+        return self._build_prefix(ctx) + self._build_suffix(ctx)
+
+    def _build_prefix(self, ctx: GenerationContext) -> str:
+        """Stable section: identical for every generation in a session."""
         profile = ctx.user_profile
 
+        # --- Anchor (current self — always present) ---
+        anchor_section = _ANCHOR_SECTION.format(
+            name=ctx.current_self.name,
+            optimization_goal=ctx.current_self.optimization_goal,
+            tone_of_voice=ctx.current_self.tone_of_voice,
+            worldview=ctx.current_self.worldview,
+            core_belief=ctx.current_self.core_belief,
+            mood=ctx.current_self.visual_style.mood,
+        )
+
+        return _PROFILE_PREFIX_TEMPLATE.format(
+            core_values=", ".join(profile.core_values),
+            fears=", ".join(profile.fears),
+            hidden_tensions=" | ".join(profile.hidden_tensions),
+            decision_style=profile.decision_style,
+            self_narrative=profile.self_narrative,
+            current_dilemma=profile.current_dilemma,
+            anchor_section=anchor_section,
+        )
+
+    def _build_suffix(self, ctx: GenerationContext) -> str:
+        """Depth-specific section: count, parent, ancestors, excerpts, siblings."""
         # --- Depth framing ---
         if ctx.parent_self is None:
             depth_framing = _ROOT_DEPTH_FRAMING
@@ -339,16 +438,6 @@ class FutureSelfGenerator:
                 parent_mood=ctx.parent_self.visual_style.mood,
             )
 
-        # --- Anchor (current self — always present) ---
-        anchor_section = _ANCHOR_SECTION.format(
-            name=ctx.current_self.name,
-            optimization_goal=ctx.current_self.optimization_goal,
-            tone_of_voice=ctx.current_self.tone_of_voice,
-            worldview=ctx.current_self.worldview,
-            core_belief=ctx.current_self.core_belief,
-            mood=ctx.current_self.visual_style.mood,
-        )
-
         # --- Parent (only at depth >= 1) ---
         parent_section = ""
         if ctx.parent_self is not None:
@@ -390,13 +479,6 @@ class FutureSelfGenerator:
         return _GENERATION_TEMPLATE.format(
             count=ctx.count,
             depth_framing=depth_framing,
-            core_values=", ".join(profile.core_values),
-            fears=", ".join(profile.fears),
-            hidden_tensions=" | ".join(profile.hidden_tensions),
-            decision_style=profile.decision_style,
-            self_narrative=profile.self_narrative,
-            current_dilemma=profile.current_dilemma,
-            anchor_section=anchor_section,
             parent_section=parent_section,
             ancestor_section=ancestor_section,
             conversation_section=conversation_section,
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speedup; stdlib json is used when unavailable.
+
+# JSON helpers shared by every module that reads or writes session storage.
+# orjson is used when installed; output is the same 2-space-indented JSON
+# either way, so files stay diffable regardless of which backend wrote them.
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json_bytes(payload: Any) -> bytes:
+    """Serialize payload as indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """
+    Replace ``path`` with ``payload`` serialized as JSON.
+
+    Each call writes its own temp file in the target directory and swaps it in
+    with os.replace, so readers never see a partial file and concurrent
+    writers never publish each other's bytes; the last replace wins.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(dump_json_bytes(payload))
+        os.chmod(tmp_name, 0o644)  # mkstemp creates 0600; keep the usual file mode.
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def sse_event(payload: dict[str, Any]) -> str:
+    """Format one Server-Sent Events data frame (compact JSON)."""
+    if orjson is not None:
+        return f"data: {orjson.dumps(payload).decode()}\n\n"
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def iter_node_files(nodes_dir: Path) -> Iterator[Path]:
+    """Yield memory node files; os.scandir skips glob's per-entry pattern matching."""
+    try:
+        with os.scandir(nodes_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
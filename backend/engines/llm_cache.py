@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+# On-disk cache for raw LLM responses. Each entry is one JSON file named by a
+# content hash of everything that shaped the prompt, so identical requests are
+# answered without a network round-trip. Entries carry a prompt version and an
+# expiry; anything stale, corrupt, or from another version is evicted on read.
+# Each write also trims the directory to _MAX_ENTRIES, dropping the oldest files.
+
+_MAX_ENTRIES = 512
+
+
+def cache_key(*fields: str) -> str:
+    # Length-prefix each field so different splits of the same bytes never collide.
+    digest = hashlib.sha256()
+    for field in fields:
+        data = field.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def read_cached_response(cache_path: Path, *, version: str) -> str | None:
+    if not cache_path.exists():
+        return None
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        payload = None
+    if (
+        isinstance(payload, dict)
+        and isinstance(payload.get("response"), str)
+        and payload.get("prompt_version") == version
+        and float(payload.get("expires_at") or 0) > time.time()
+    ):
+        return payload["response"]
+    # Corrupt, stale, or expired: evict and let the caller refill it.
+    cache_path.unlink(missing_ok=True)
+    return None
+
+
+def write_cached_response(
+    cache_path: Path,
+    response: str,
+    *,
+    version: str,
+    ttl_seconds: float,
+) -> None:
+    now = time.time()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(
+        json.dumps(
+            {
+                "response": response,
+                "created_at": now,
+                "expires_at": now + ttl_seconds,
+                "prompt_version": version,
+            }
+        ),
+        encoding="utf-8",
+    )
+    _prune_cache_dir(cache_path.parent)
+
+
+def _prune_cache_dir(cache_dir: Path) -> None:
+    entries: list[tuple[float, str]] = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue  # Removed by a concurrent prune.
+    except FileNotFoundError:
+        return
+    excess = len(entries) - _MAX_ENTRIES
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, path in entries[:excess]:
+        Path(path).unlink(missing_ok=True)
@@ -12,19 +12,27 @@ while maintaining state consistency and proper error handling.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import time
 from pathlib import Path
 from typing import Any
 
 from backend.config.settings import get_settings
 from backend.engines.avatar_generator import AvatarGenerator
+from backend.engines.bounded_cache import BoundedCache
 from backend.engines.current_self_auto_generator import (
     CurrentSelfAutoGeneratorEngine,
     CurrentSelfGenerationContext,
 )
+from backend.engines.json_io import load_json_bytes, write_json_atomic
 from backend.models.schemas import GenerateFutureSelvesRequest, SelfCard, UserProfile
-from backend.routers.future_self import generate_future_selves
+from backend.routers.future_self import generate_future_selves, session_write_lock
+
+
+# Snapshots hold a full session plus validated cards, so keep only recent ones;
+# status dicts are small and polled often.
+_SNAPSHOT_CACHE_SIZE = 32
+_STATUS_CACHE_SIZE = 256
 
 
 class PipelineOrchestratorError(Exception):
@@ -42,6 +50,12 @@ class PipelineOrchestrator:
 
     def __init__(self, storage_root: str | None = None):
         self.storage_root = storage_root or get_settings().storage_root
+        # The orchestrator lives for the whole process (see routers/pipeline.py),
+        # so both per-session caches are bounded LRUs rather than plain dicts.
+        # session_id -> (file stamp, status dict); see get_pipeline_status
+        self._status_cache = BoundedCache(_STATUS_CACHE_SIZE)
+        # session_id -> (file stamp, session dict, parsed futureSelvesFull)
+        self._snapshot_cache = BoundedCache(_SNAPSHOT_CACHE_SIZE)
 
     # ---------------------------------------------------------------------------
     # Storage helpers
@@ -56,69 +70,41 @@ class PipelineOrchestrator:
         path = self._get_session_path(session_id)
         if not path.exists():
             raise PipelineOrchestratorError(f"Session {session_id} not found")
-        with open(path) as f:
-            return json.load(f)
+        return load_json_bytes(path.read_bytes())
+
+    def _load_session_snapshot(
+        self, session_id: str
+    ) -> tuple[dict[str, Any], dict[str, SelfCard]]:
+        """
+        Load session plus parsed futureSelvesFull cards, cached until the file changes.
+
+        The returned objects are shared between callers and must be treated as
+        read-only; use _load_session for a copy that will be modified and saved.
+        """
+        path = self._get_session_path(session_id)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise PipelineOrchestratorError(f"Session {session_id} not found") from None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._snapshot_cache.get(session_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+
+        session_data = self._load_session(session_id)
+        cards = {
+            self_id: SelfCard.model_validate(data)
+            for self_id, data in session_data.get("futureSelvesFull", {}).items()
+        }
+        self._snapshot_cache.put(session_id, (stamp, session_data, cards))
+        return session_data, cards
 
     def _save_session(self, session_id: str, session_data: dict[str, Any]) -> None:
         """Save session to disk, updating timestamp."""
         session_data["updatedAt"] = time.time()
         path = self._get_session_path(session_id)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(session_data, f, indent=2)
-
-    def _initialize_memory_tree(self, session_id: str, current_self: SelfCard) -> None:
-        """
-        Initialize memory tree structure with root node.
-        
-        Creates memory/nodes/ directory and root node with currentSelf.
-        This is called when onboarding completes.
-        """
-        session_dir = Path(self.storage_root) / session_id
-        nodes_dir = session_dir / "memory" / "nodes"
-        nodes_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create root node with currentSelf
-        now = time.time()
-        root_node_id = "root_node"
-        
-        root_node = {
-            "id": root_node_id,
-            "parentId": None,  # Root has no parent
-            "branchLabel": "root",
-            "facts": [
-                {
-                    "id": f"fact_{root_node_id}_0",
-                    "fact": f"Current self: {current_self.name}",
-                    "source": "onboarding",
-                    "extractedAt": now,
-                },
-                {
-                    "id": f"fact_{root_node_id}_1",
-                    "fact": f"Optimization goal: {current_self.optimization_goal}",
-                    "source": "onboarding",
-                    "extractedAt": now,
-                }
-            ],
-            "notes": ["Root node created during onboarding"],
-            "selfCard": current_self.model_dump(by_alias=True),
-            "createdAt": now,
-        }
-        
-        # Write root node
-        root_node_file = nodes_dir / f"{root_node_id}.json"
-        root_node_file.write_text(json.dumps(root_node, indent=2), encoding="utf-8")
-        
-        # Initialize branches.json with root branch
-        branches_file = session_dir / "memory" / "branches.json"
-        branches = [
-            {
-                "name": "root",
-                "headNodeId": root_node_id,
-                "parentBranchName": None,
-            }
-        ]
-        branches_file.write_text(json.dumps(branches, indent=2), encoding="utf-8")
+        write_json_atomic(path, session_data)
 
     def _get_transcript_path(self, session_id: str) -> Path:
         """Get path to transcript.json file."""
@@ -129,8 +115,20 @@ class PipelineOrchestrator:
         path = self._get_transcript_path(session_id)
         if not path.exists():
             return []
-        with open(path) as f:
-            return json.load(f)
+        return load_json_bytes(path.read_bytes())
+
+    def _status_stamp(self, session_id: str) -> tuple[int, ...] | None:
+        """Return mtime/size stamps of the files pipeline status is derived from."""
+        try:
+            session_stat = self._get_session_path(session_id).stat()
+        except FileNotFoundError:
+            return None
+        try:
+            transcript_stat = self._get_transcript_path(session_id).stat()
+            transcript_stamp = (transcript_stat.st_mtime_ns, transcript_stat.st_size)
+        except FileNotFoundError:
+            transcript_stamp = (0, 0)
+        return (session_stat.st_mtime_ns, session_stat.st_size, *transcript_stamp)
 
     def _persist_avatar_urls(self, session_id: str, cards: list[SelfCard]) -> None:
         """Write generated avatar_urls back into the saved session for the given cards."""
@@ -144,6 +142,12 @@ class PipelineOrchestrator:
 
     def _calculate_completeness(self, profile: UserProfile) -> float:
         """Calculate profile completeness as 0-1."""
+        career = profile.career
+        financial = profile.financial
+        personal = profile.personal
+        health = profile.health
+        life_situation = profile.life_situation
+
         total_fields = 20
         filled_fields = 0
 
@@ -159,27 +163,27 @@ class PipelineOrchestrator:
             filled_fields += 1
         if profile.current_dilemma:
             filled_fields += 1
-        if profile.career.job_title:
+        if career.job_title:
             filled_fields += 1
-        if profile.career.career_goal:
+        if career.career_goal:
             filled_fields += 1
-        if profile.financial.income_level:
+        if financial.income_level:
             filled_fields += 1
-        if profile.financial.money_mindset:
+        if financial.money_mindset:
             filled_fields += 1
-        if profile.personal.relationships:
+        if personal.relationships:
             filled_fields += 1
-        if profile.personal.hobbies:
+        if personal.hobbies:
             filled_fields += 1
-        if profile.personal.personal_values:
+        if personal.personal_values:
             filled_fields += 1
-        if profile.health.mental_health:
+        if health.mental_health:
             filled_fields += 1
-        if profile.health.physical_health:
+        if health.physical_health:
             filled_fields += 1
-        if profile.life_situation.current_location:
+        if life_situation.current_location:
             filled_fields += 1
-        if profile.life_situation.life_stage:
+        if life_situation.life_stage:
             filled_fields += 1
 
         return min(1.0, filled_fields / total_fields)
@@ -210,7 +214,7 @@ class PipelineOrchestrator:
             InvalidStateError: If profile incomplete or CurrentSelf already exists
             PipelineOrchestratorError: If generation fails
         """
-        session_data = self._load_session(session_id)
+        session_data = await asyncio.to_thread(self._load_session, session_id)
 
         # Validate state
         if session_data.get("currentSelf"):
@@ -260,13 +264,14 @@ class PipelineOrchestrator:
 
         # Save to session
         session_data["userProfile"] = profile.model_dump(mode="json")
+        session_data["profileCompleteness"] = self._calculate_completeness(profile)
         session_data["currentSelf"] = current_self.model_dump(mode="json")
         session_data["status"] = "ready_for_future_self_generation"
 
-        # Initialize memory tree structure with root node
-        self._initialize_memory_tree(session_id, current_self)
+        # Memory tree is built lazily when exploration starts
+        session_data["memoryTreePending"] = True
 
-        self._save_session(session_id, session_data)
+        await asyncio.to_thread(self._save_session, session_id, session_data)
 
         return profile, current_self
 
@@ -292,7 +297,7 @@ class PipelineOrchestrator:
             InvalidStateError: If CurrentSelf not present or futures already generated
             PipelineOrchestratorError: If generation fails
         """
-        session_data = self._load_session(session_id)
+        session_data, _ = await asyncio.to_thread(self._load_session_snapshot, session_id)
         if not session_data.get("currentSelf"):
             raise InvalidStateError(
                 f"Session {session_id} has no CurrentSelf. Complete onboarding first."
@@ -319,7 +324,8 @@ class PipelineOrchestrator:
 
         # Generate avatars in parallel and persist updated URLs to session
         selves = await AvatarGenerator().generate_all(selves, session_id)
-        self._persist_avatar_urls(session_id, selves)
+        async with session_write_lock(self.storage_root, session_id):
+            await asyncio.to_thread(self._persist_avatar_urls, session_id, selves)
         return selves
 
     async def branch_from_conversation(
@@ -327,7 +333,7 @@ class PipelineOrchestrator:
         session_id: str,
         parent_self_id: str,
         num_futures: int = 3,
-    ) -> list[SelfCard]:
+    ) -> tuple[SelfCard, list[SelfCard]]:
         """
         Generate deeper future selves from conversation context.
 
@@ -341,20 +347,20 @@ class PipelineOrchestrator:
             num_futures: Number of future selves to generate
 
         Returns:
-            List of generated child SelfCards
+            Tuple of (parent SelfCard, list of generated child SelfCards)
 
         Raises:
             InvalidStateError: If parent self not found or no conversation history
             PipelineOrchestratorError: If generation fails
         """
-        session_data = self._load_session(session_id)
-        future_selves_full = session_data.get("futureSelvesFull", {})
-        if parent_self_id not in future_selves_full:
+        _, cards = await asyncio.to_thread(self._load_session_snapshot, session_id)
+        parent_self = cards.get(parent_self_id)
+        if parent_self is None:
             raise InvalidStateError(
                 f"Parent self {parent_self_id} not found in session {session_id}"
             )
 
-        transcript = self._load_transcript(session_id)
+        transcript = await asyncio.to_thread(self._load_transcript, session_id)
         has_conversation = any(
             t.get("phase") == "conversation" and t.get("selfId") == parent_self_id
             for t in transcript
@@ -382,8 +388,9 @@ class PipelineOrchestrator:
 
         # Generate avatars in parallel and persist updated URLs to session
         selves = await AvatarGenerator().generate_all(selves, session_id)
-        self._persist_avatar_urls(session_id, selves)
-        return selves
+        async with session_write_lock(self.storage_root, session_id):
+            await asyncio.to_thread(self._persist_avatar_urls, session_id, selves)
+        return parent_self, selves
 
     def get_pipeline_status(self, session_id: str) -> dict[str, Any]:
         """
@@ -396,8 +403,16 @@ class PipelineOrchestrator:
         - current_self: CurrentSelf if exists
         - future_selves_count: Number of generated future selves
         - conversation_branches: Selves with conversation history
+
+        Results are cached per session until session.json or transcript.json
+        changes on disk, so repeated polling skips the reload.
         """
-        session_data = self._load_session(session_id)
+        stamp = self._status_stamp(session_id)
+        cached = self._status_cache.get(session_id)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        session_data, cards = self._load_session_snapshot(session_id)
 
         phase = session_data.get("status", "onboarding")
         current_self = session_data.get("currentSelf")
@@ -426,15 +441,15 @@ class PipelineOrchestrator:
         # Get selves with conversation for branching opportunities
         conversation_branches = []
         for self_id in selves_with_conversation:
-            if self_id in future_selves_full:
-                self_card = SelfCard(**future_selves_full[self_id])
+            self_card = cards.get(self_id)
+            if self_card is not None:
                 conversation_branches.append({
                     "self_id": self_id,
                     "name": self_card.name,
                     "depth": self_card.depth_level,
                 })
 
-        return {
+        status_data = {
             "session_id": session_id,
             "phase": phase,
             "status": session_data.get("status"),
@@ -442,8 +457,11 @@ class PipelineOrchestrator:
             "current_self": current_self,
             "future_selves_count": len(future_selves_full),
             "exploration_depth": max(
-                (SelfCard(**s).depth_level for s in future_selves_full.values()),
+                (card.depth_level for card in cards.values()),
                 default=0
             ),
             "conversation_branches": conversation_branches,
         }
+        if stamp is not None:
+            self._status_cache.put(session_id, (stamp, status_data))
+        return status_data
@@ -386,6 +386,12 @@ Return a complete profile extraction in JSON format with all fields populated (u
 
     def _calculate_completeness(self, profile: UserProfile) -> float:
         """Calculate profile completeness as 0-1 score."""
+        career = profile.career
+        financial = profile.financial
+        personal = profile.personal
+        health = profile.health
+        life_situation = profile.life_situation
+
         total_fields = 25  # Approximate count of extractable fields
         filled_fields = 0
         
@@ -404,43 +410,49 @@ Return a complete profile extraction in JSON format with all fields populated (u
             filled_fields += 1
         
         # Career
-        if profile.career.job_title:
+        if career.job_title:
             filled_fields += 1
-        if profile.career.industry:
+        if career.industry:
             filled_fields += 1
-        if profile.career.career_goal:
+        if career.career_goal:
             filled_fields += 1
         
         # Financial
-        if profile.financial.income_level:
+        if financial.income_level:
             filled_fields += 1
-        if profile.financial.money_mindset:
+        if financial.money_mindset:
             filled_fields += 1
         
         # Personal
-        if profile.personal.relationships:
+        if personal.relationships:
             filled_fields += 1
-        if profile.personal.hobbies:
+        if personal.hobbies:
             filled_fields += 1
-        if profile.personal.personal_values:
+        if personal.personal_values:
             filled_fields += 1
         
         # Health
-        if profile.health.physical_health:
+        if health.physical_health:
             filled_fields += 1
-        if profile.health.mental_health:
+        if health.mental_health:
             filled_fields += 1
         
         # Life situation
-        if profile.life_situation.current_location:
+        if life_situation.current_location:
             filled_fields += 1
-        if profile.life_situation.life_stage:
+        if life_situation.life_stage:
             filled_fields += 1
         
         return min(1.0, filled_fields / total_fields)
 
     def _build_extracted_fields(self, profile: UserProfile) -> dict[str, bool]:
         """Build extracted_fields dict for UI feedback."""
+        career = profile.career
+        financial = profile.financial
+        personal = profile.personal
+        health = profile.health
+        life_situation = profile.life_situation
+
         return {
             "core_values": bool(profile.core_values),
             "fears": bool(profile.fears),
@@ -448,18 +460,18 @@ Return a complete profile extraction in JSON format with all fields populated (u
             "decision_style": bool(profile.decision_style),
             "self_narrative": bool(profile.self_narrative),
             "current_dilemma": bool(profile.current_dilemma),
-            "job_title": bool(profile.career.job_title),
-            "industry": bool(profile.career.industry),
-            "career_goal": bool(profile.career.career_goal),
-            "income_level": bool(profile.financial.income_level),
-            "money_mindset": bool(profile.financial.money_mindset),
-            "relationships": bool(profile.personal.relationships),
-            "hobbies": bool(profile.personal.hobbies),
-            "personal_values": bool(profile.personal.personal_values),
-            "physical_health": bool(profile.health.physical_health),
-            "mental_health": bool(profile.health.mental_health),
-            "current_location": bool(profile.life_situation.current_location),
-            "life_stage": bool(profile.life_situation.life_stage),
+            "job_title": bool(career.job_title),
+            "industry": bool(career.industry),
+            "career_goal": bool(career.career_goal),
+            "income_level": bool(financial.income_level),
+            "money_mindset": bool(financial.money_mindset),
+            "relationships": bool(personal.relationships),
+            "hobbies": bool(personal.hobbies),
+            "personal_values": bool(personal.personal_values),
+            "physical_health": bool(health.physical_health),
+            "mental_health": bool(health.mental_health),
+            "current_location": bool(life_situation.current_location),
+            "life_stage": bool(life_situation.life_stage),
         }
 
     def _check_readiness_for_current_self_gen(self, profile: UserProfile) -> bool:
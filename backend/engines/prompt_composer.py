@@ -73,15 +73,25 @@ class PromptComposer:
         context: ResolvedConversationContext,
         user_message: str,
         history: Iterable[ChatMessage] | None = None,
+        *,
+        system_prompt: str | None = None,
     ) -> list[ChatMessage]:
+        """
+        Build the message list for one turn.
+
+        Pass a ``system_prompt`` previously built by compose_system_prompt to
+        reuse it across turns of the same context instead of rebuilding it.
+        """
         if not user_message.strip():
             raise ValueError("user_message cannot be empty")
 
-        messages: list[ChatMessage] = [
-            {"role": "system", "content": self.compose_system_prompt(context)}
-        ]
+        if system_prompt is None:
+            system_prompt = self.compose_system_prompt(context)
+        messages: list[ChatMessage] = [{"role": "system", "content": system_prompt}]
 
-        clipped_history = list(history or [])[-self.config.max_history_turns :]
+        if not isinstance(history, list):
+            history = list(history or [])
+        clipped_history = history[-self.config.max_history_turns :]
         for item in clipped_history:
             role = item.get("role")
             content = item.get("content", "")
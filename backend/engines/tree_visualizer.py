@@ -7,13 +7,14 @@ Provides ASCII visualization, path finding, and statistics for CLI and testing.
 
 from __future__ import annotations
 
-import json
 from collections import deque
 from pathlib import Path
 from typing import Any
 
 from backend.models.schemas import SelfCard
 
+from .json_io import load_json_bytes
+
 
 class TreeVisualizerError(Exception):
     """Base exception for tree visualization errors."""
@@ -25,20 +26,53 @@ class TreeVisualizer:
 
     def __init__(self, storage_root: str):
         self.storage_root = storage_root
+        # path -> ((mtime_ns, size), parsed JSON); reused until the file changes.
+        self._json_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+        # session_id -> ((mtime_ns, size), parsed futureSelvesFull cards)
+        self._cards_cache: dict[str, tuple[tuple[int, int], dict[str, SelfCard]]] = {}
+
+    def _load_cached_json(self, path: Path) -> tuple[tuple[int, int], Any] | None:
+        """Parse a JSON file once per (mtime_ns, size); cached values are read-only."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, load_json_bytes(path.read_bytes()))
+            self._json_cache[path] = cached
+        return cached
 
     def _load_session(self, session_id: str) -> dict[str, Any]:
         """Load session data."""
-        session_path = Path(self.storage_root) / session_id / "session.json"
-        if not session_path.exists():
+        cached = self._load_cached_json(Path(self.storage_root) / session_id / "session.json")
+        if cached is None:
             raise TreeVisualizerError(f"Session {session_id} not found")
-        return json.loads(session_path.read_text())
+        return cached[1]
 
     def _load_transcript(self, session_id: str) -> list[dict[str, Any]]:
         """Load transcript data."""
-        transcript_path = Path(self.storage_root) / session_id / "transcript.json"
-        if not transcript_path.exists():
+        cached = self._load_cached_json(Path(self.storage_root) / session_id / "transcript.json")
+        if cached is None:
             return []
-        return json.loads(transcript_path.read_text())
+        return cached[1]
+
+    def _self_cards(self, session_id: str) -> dict[str, SelfCard]:
+        """Parsed futureSelvesFull, validated once per session.json version."""
+        cached = self._load_cached_json(Path(self.storage_root) / session_id / "session.json")
+        if cached is None:
+            raise TreeVisualizerError(f"Session {session_id} not found")
+        stamp, session_data = cached
+        cards_entry = self._cards_cache.get(session_id)
+        if cards_entry is None or cards_entry[0] != stamp:
+            cards = {
+                self_id: SelfCard.model_validate(self_data)
+                for self_id, self_data in session_data.get("futureSelvesFull", {}).items()
+            }
+            cards_entry = (stamp, cards)
+            self._cards_cache[session_id] = cards_entry
+        return cards_entry[1]
 
     def render_tree(
         self,
@@ -59,7 +93,7 @@ class TreeVisualizer:
         """
         session_data = self._load_session(session_id)
         current_self = session_data.get("currentSelf")
-        future_selves_full = session_data.get("futureSelvesFull", {})
+        cards = self._self_cards(session_id)
         exploration_paths = session_data.get("explorationPaths", {})
 
         if not current_self:
@@ -76,20 +110,14 @@ class TreeVisualizer:
         lines.append(f"🌱 {current_name} (Current)")
         lines.append("")
 
-        # Build tree recursively
-        if "root" in exploration_paths:
-            root_children = exploration_paths["root"]
-            for i, child_id in enumerate(root_children):
-                is_last = i == len(root_children) - 1
-                self._render_node(
-                    lines=lines,
-                    self_id=child_id,
-                    future_selves_full=future_selves_full,
-                    exploration_paths=exploration_paths,
-                    current_self_id=current_self_id,
-                    prefix="",
-                    is_last=is_last,
-                )
+        # Build tree depth-first
+        self._render_subtrees(
+            lines=lines,
+            root_ids=exploration_paths.get("root", []),
+            cards=cards,
+            exploration_paths=exploration_paths,
+            current_self_id=current_self_id,
+        )
 
         if show_stats:
             lines.append("")
@@ -112,59 +140,53 @@ class TreeVisualizer:
 
         return "\n".join(lines)
 
-    def _render_node(
+    def _render_subtrees(
         self,
         lines: list[str],
-        self_id: str,
-        future_selves_full: dict[str, Any],
+        root_ids: list[str],
+        cards: dict[str, SelfCard],
         exploration_paths: dict[str, list[str]],
         current_self_id: str | None,
-        prefix: str,
-        is_last: bool,
     ) -> None:
-        """Recursively render a node and its children."""
-        if self_id not in future_selves_full:
-            return
+        """Render nodes and their descendants in pre-order with an explicit stack."""
+        # (self_id, prefix, is_last, ids on the path from the root); children
+        # are pushed in reverse so they pop in exploration order.
+        stack: list[tuple[str, str, bool, frozenset[str]]] = [
+            (child_id, "", i == len(root_ids) - 1, frozenset())
+            for i, child_id in reversed(list(enumerate(root_ids)))
+        ]
+        while stack:
+            self_id, prefix, is_last, ancestors = stack.pop()
+            self_card = cards.get(self_id)
+            if self_card is None or self_id in ancestors:
+                continue
 
-        self_data = future_selves_full[self_id]
-        self_card = SelfCard(**self_data)
+            # Determine connector
+            connector = "└── " if is_last else "├── "
 
-        # Determine connector
-        connector = "└── " if is_last else "├── "
-        
-        # Highlight current self
-        highlight = "→ " if self_id == current_self_id else "  "
-        
-        # Format node line
-        node_line = f"{prefix}{connector}{highlight}{self_card.name}"
-        
-        # Add depth indicator
-        node_line += f" (depth {self_card.depth_level})"
-        
-        # Add conversation indicator
-        if self_card.children_ids:
-            node_line += f" [+{len(self_card.children_ids)} children]"
-        
-        lines.append(node_line)
-
-        # Render children
-        children_ids = exploration_paths.get(self_id, [])
-        if children_ids:
-            # Prepare prefix for children
-            extension = "    " if is_last else "│   "
-            new_prefix = prefix + extension
-
-            for i, child_id in enumerate(children_ids):
-                child_is_last = i == len(children_ids) - 1
-                self._render_node(
-                    lines=lines,
-                    self_id=child_id,
-                    future_selves_full=future_selves_full,
-                    exploration_paths=exploration_paths,
-                    current_self_id=current_self_id,
-                    prefix=new_prefix,
-                    is_last=child_is_last,
-                )
+            # Highlight current self
+            highlight = "→ " if self_id == current_self_id else "  "
+
+            # Format node line
+            node_line = f"{prefix}{connector}{highlight}{self_card.name}"
+
+            # Add depth indicator
+            node_line += f" (depth {self_card.depth_level})"
+
+            # Add conversation indicator
+            if self_card.children_ids:
+                node_line += f" [+{len(self_card.children_ids)} children]"
+
+            lines.append(node_line)
+
+            # Queue children
+            children_ids = exploration_paths.get(self_id, [])
+            if children_ids:
+                new_prefix = prefix + ("    " if is_last else "│   ")
+                path = ancestors | {self_id}
+                last = len(children_ids) - 1
+                for i in range(last, -1, -1):
+                    stack.append((children_ids[i], new_prefix, i == last, path))
 
     def get_navigation_path(
         self,
@@ -240,8 +262,7 @@ class TreeVisualizer:
         - depth_distribution: Dict mapping depth level to count of selves
         - conversation_distribution: Dict mapping self_id to conversation turn count
         """
-        session_data = self._load_session(session_id)
-        future_selves_full = session_data.get("futureSelvesFull", {})
+        cards = self._self_cards(session_id)
         transcript = self._load_transcript(session_id)
 
         # Count conversation turns per self
@@ -256,14 +277,13 @@ class TreeVisualizer:
         depth_dist: dict[int, int] = {}
         max_depth = 0
 
-        for self_data in future_selves_full.values():
-            self_card = SelfCard(**self_data)
+        for self_card in cards.values():
             depth = self_card.depth_level
             depth_dist[depth] = depth_dist.get(depth, 0) + 1
             max_depth = max(max_depth, depth)
 
         return {
-            "total_selves": len(future_selves_full),
+            "total_selves": len(cards),
             "max_depth": max_depth,
             "branches_with_conversations": len(conversation_counts),
             "total_conversation_turns": sum(conversation_counts.values()),
@@ -286,8 +306,7 @@ class TreeVisualizer:
         Returns:
             List of dicts with self_id, name, depth_level, conversation_turns
         """
-        session_data = self._load_session(session_id)
-        future_selves_full = session_data.get("futureSelvesFull", {})
+        cards = self._self_cards(session_id)
         transcript = self._load_transcript(session_id)
 
         # Count conversation turns
@@ -299,8 +318,7 @@ class TreeVisualizer:
                     conversation_counts[self_id] = conversation_counts.get(self_id, 0) + 1
 
         branches = []
-        for self_id, self_data in future_selves_full.items():
-            self_card = SelfCard(**self_data)
+        for self_id, self_card in cards.items():
             conv_turns = conversation_counts.get(self_id, 0)
 
             if with_conversations_only and conv_turns == 0:
@@ -331,34 +349,27 @@ class TreeVisualizer:
         Returns:
             List of ancestor dicts (self_id, name, depth_level) from root to parent
         """
-        session_data = self._load_session(session_id)
-        future_selves_full = session_data.get("futureSelvesFull", {})
+        cards = self._self_cards(session_id)
 
-        if self_id not in future_selves_full:
+        if self_id not in cards:
             raise TreeVisualizerError(f"Self {self_id} not found")
 
         ancestors = []
-        current_id = self_id
-        current_data = future_selves_full[current_id]
-        current_card = SelfCard(**current_data)
+        current_card = cards[self_id]
 
         # Traverse up to root
         while current_card.parent_self_id:
             parent_id = current_card.parent_self_id
-            if parent_id not in future_selves_full:
+            parent_card = cards.get(parent_id)
+            if parent_card is None:
                 break
 
-            parent_data = future_selves_full[parent_id]
-            parent_card = SelfCard(**parent_data)
-
             ancestors.append({
                 "self_id": parent_id,
                 "name": parent_card.name,
                 "depth_level": parent_card.depth_level,
             })
 
-            current_id = parent_id
-            current_data = parent_data
             current_card = parent_card
 
         # Reverse to get root-to-parent order
@@ -378,14 +389,13 @@ class TreeVisualizer:
             List of sibling dicts (self_id, name, depth_level), excluding self
         """
         session_data = self._load_session(session_id)
-        future_selves_full = session_data.get("futureSelvesFull", {})
+        cards = self._self_cards(session_id)
         exploration_paths = session_data.get("explorationPaths", {})
 
-        if self_id not in future_selves_full:
+        if self_id not in cards:
             raise TreeVisualizerError(f"Self {self_id} not found")
 
-        self_data = future_selves_full[self_id]
-        self_card = SelfCard(**self_data)
+        self_card = cards[self_id]
 
         parent_id = self_card.parent_self_id or "root"
         sibling_ids = exploration_paths.get(parent_id, [])
@@ -395,9 +405,8 @@ class TreeVisualizer:
             if sibling_id == self_id:
                 continue
 
-            if sibling_id in future_selves_full:
-                sibling_data = future_selves_full[sibling_id]
-                sibling_card = SelfCard(**sibling_data)
+            sibling_card = cards.get(sibling_id)
+            if sibling_card is not None:
 
                 siblings.append({
                     "self_id": sibling_id,
@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import base64
 import binascii
-import json
 import re
 from typing import Any, AsyncGenerator, Iterator
 
@@ -25,6 +24,7 @@ from backend.engines import (
     looks_like_placeholder_voice_id,
 )
 from backend.engines.context_resolver import ContextResolutionError
+from backend.engines.json_io import sse_event
 from backend.models.schemas import (
     ConversationTranscribeRequest,
     ConversationTranscribeResponse,
@@ -424,7 +424,7 @@ async def _stream_conversation_reply(
                     break
                 
                 full_reply_chunks.append(chunk)
-                yield f"data: {json.dumps({'type': 'chunk', 'data': chunk})}\n\n"
+                yield sse_event({"type": "chunk", "data": chunk})
             except StopIteration:
                 break
         
@@ -448,10 +448,12 @@ async def _stream_conversation_reply(
             pass
         
         # Send completion event
-        yield f"data: {json.dumps({'type': 'done', 'data': {'branch_name': branch_name, 'full_reply': full_reply}})}\n\n"
+        yield sse_event(
+            {"type": "done", "data": {"branch_name": branch_name, "full_reply": full_reply}}
+        )
         
     except Exception as exc:
-        yield f"data: {json.dumps({'type': 'error', 'data': str(exc)})}\n\n"
+        yield sse_event({"type": "error", "data": str(exc)})
 
 
 @router.post("/transcribe", response_model=ConversationTranscribeResponse)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import time
+import weakref
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -10,7 +11,10 @@ from backend.config.runtime import get_runtime_config
 from backend.config.settings import Settings, get_settings
 from backend.engines import ContextResolver
 from backend.engines.avatar_generator import AvatarGenerator
-from backend.engines.conversation_memory import analyze_and_persist_transcript_insights
+from backend.engines.conversation_memory import (
+    extract_transcript_insights,
+    persist_transcript_insights,
+)
 from backend.engines.context_resolver import ContextResolutionError
 from backend.engines.future_gen_context import (
     collect_sibling_names,
@@ -21,6 +25,7 @@ from backend.engines.future_self_generator import (
     GenerationContext,
     hash_id,
 )
+from backend.engines.json_io import iter_node_files, load_json_bytes, write_json_atomic
 from backend.models.schemas import (
     GenerateFutureSelvesRequest,
     GenerateFutureSelvesResponse,
@@ -31,16 +36,38 @@ from backend.models.schemas import (
 router = APIRouter(prefix="/future-self", tags=["future-self"])
 _runtime_fg = get_runtime_config().future_generation
 
-def _get_generator() -> FutureSelfGenerator:
-    # Create a fresh generator per invocation to avoid reusing async clients
-    # across closed event loops when CLI paths call asyncio.run multiple times.
-    return FutureSelfGenerator()
+def _get_generator(settings: Settings) -> FutureSelfGenerator:
+    # The generator is cheap; its SDK client is shared per event loop, so CLI
+    # paths that call asyncio.run multiple times never reuse a closed loop's pool.
+    return FutureSelfGenerator(cache_dir=Path(settings.llm_cache_path))
 
 
 # ---------------------------------------------------------------------------
 # Storage helpers
 # ---------------------------------------------------------------------------
 
+# (resolved storage path, session_id) -> lock; entries vanish once no request holds them.
+_session_locks: weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def session_write_lock(storage_path: str, session_id: str) -> asyncio.Lock:
+    """
+    Lock guarding session.json read-modify-write within this process.
+
+    Generation awaits the LLM between loading and saving the session, so
+    concurrent generations on one session (e.g. sibling branches) must
+    re-read and commit under this lock or one would drop the other's selves.
+    """
+    key = (str(Path(storage_path).resolve()), session_id)
+    lock = _session_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[key] = lock
+    return lock
+
+
 def _session_dir(session_id: str, storage_path: str) -> Path:
     return Path(storage_path) / session_id
 
@@ -49,12 +76,12 @@ def _load_session(session_id: str, storage_path: str) -> dict:
     session_file = _session_dir(session_id, storage_path) / "session.json"
     if not session_file.exists():
         raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found")
-    return json.loads(session_file.read_text(encoding="utf-8"))
+    return load_json_bytes(session_file.read_bytes())
 
 
 def _save_session(session_id: str, storage_path: str, data: dict) -> None:
     session_file = _session_dir(session_id, storage_path) / "session.json"
-    session_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    write_json_atomic(session_file, data)
 
 
 def _append_transcript_entry(
@@ -62,19 +89,78 @@ def _append_transcript_entry(
 ) -> None:
     transcript_file = _session_dir(session_id, storage_path) / "transcript.json"
     transcript = (
-        json.loads(transcript_file.read_text(encoding="utf-8"))
+        load_json_bytes(transcript_file.read_bytes())
         if transcript_file.exists()
         else []
     )
     transcript.append(entry)
-    transcript_file.write_text(json.dumps(transcript, indent=2), encoding="utf-8")
+    write_json_atomic(transcript_file, transcript)
+
+
+def _ensure_memory_tree(session_id: str, storage_path: str, session_data: dict) -> None:
+    """
+    Build the root memory node and branches.json on first exploration.
+
+    Onboarding only flags the session with ``memoryTreePending``; the tree is
+    materialized here so abandoned sessions never pay for it. Sessions without
+    the flag already have their tree on disk.
+    """
+    if not session_data.pop("memoryTreePending", False):
+        return
+
+    raw_current_self = session_data.get("currentSelf")
+    if not raw_current_self:
+        return
+    current_self = SelfCard.model_validate(raw_current_self)
+
+    memory_dir = _session_dir(session_id, storage_path) / "memory"
+    nodes_dir = memory_dir / "nodes"
+    nodes_dir.mkdir(parents=True, exist_ok=True)
+
+    now = time.time()
+    root_node_id = "root_node"
+    root_node = {
+        "id": root_node_id,
+        "parentId": None,  # Root has no parent
+        "branchLabel": "root",
+        "facts": [
+            {
+                "id": f"fact_{root_node_id}_0",
+                "fact": f"Current self: {current_self.name}",
+                "source": "onboarding",
+                "extractedAt": now,
+            },
+            {
+                "id": f"fact_{root_node_id}_1",
+                "fact": f"Optimization goal: {current_self.optimization_goal}",
+                "source": "onboarding",
+                "extractedAt": now,
+            },
+        ],
+        "notes": ["Root node created during onboarding"],
+        "selfCard": current_self.model_dump(by_alias=True),
+        "createdAt": now,
+    }
+    write_json_atomic(nodes_dir / f"{root_node_id}.json", root_node)
+
+    # Never clobber branches written by an earlier, partially failed run
+    branches_file = memory_dir / "branches.json"
+    if not branches_file.exists():
+        branches = [{"name": "root", "headNodeId": root_node_id, "parentBranchName": None}]
+        write_json_atomic(branches_file, branches)
 
 
 def _find_root_node_id(session_id: str, storage_path: str) -> str:
     """Find the root memory node ID (node with parentId=null)"""
     nodes_dir = _session_dir(session_id, storage_path) / "memory" / "nodes"
-    for node_file in nodes_dir.glob("*.json"):
-        node = json.loads(node_file.read_text(encoding="utf-8"))
+    # Trees materialized by _ensure_memory_tree use a fixed root id; try it first.
+    root_file = nodes_dir / "root_node.json"
+    if root_file.exists():
+        node = load_json_bytes(root_file.read_bytes())
+        if node.get("parentId") is None:
+            return node["id"]
+    for node_file in iter_node_files(nodes_dir):
+        node = load_json_bytes(node_file.read_bytes())
         if node.get("parentId") is None:
             return node["id"]
     raise ValueError("Root node not found")
@@ -83,8 +169,8 @@ def _find_root_node_id(session_id: str, storage_path: str) -> str:
 def _find_node_id_for_self(session_id: str, storage_path: str, self_id: str) -> str:
     """Find the memory node ID for a given self_id"""
     nodes_dir = _session_dir(session_id, storage_path) / "memory" / "nodes"
-    for node_file in nodes_dir.glob("*.json"):
-        node = json.loads(node_file.read_text(encoding="utf-8"))
+    for node_file in iter_node_files(nodes_dir):
+        node = load_json_bytes(node_file.read_bytes())
         self_card = node.get("selfCard")
         if self_card and self_card.get("id") == self_id:
             return node["id"]
@@ -99,6 +185,7 @@ def _create_memory_branches(
     parent_branch_name: str,
     now: float,
     session_data: dict,
+    card_dicts: dict[str, dict] | None = None,
 ) -> None:
     """
     For each generated future self:
@@ -108,19 +195,21 @@ def _create_memory_branches(
     Supports multi-level branching by linking to parent node and branch.
     Idempotent — skips branches that already exist by name.
     Also updates session_data['memoryBranches'] in place so the caller
-    can persist it back to session.json.
+    can persist it back to session.json. ``card_dicts`` (self id -> aliased
+    dump) lets the caller reuse dumps it already made.
     """
     nodes_dir = _session_dir(session_id, storage_path) / "memory" / "nodes"
     nodes_dir.mkdir(parents=True, exist_ok=True)
 
     branches_file = _session_dir(session_id, storage_path) / "memory" / "branches.json"
     branches: list[dict] = (
-        json.loads(branches_file.read_text(encoding="utf-8"))
+        load_json_bytes(branches_file.read_bytes())
         if branches_file.exists()
         else []
     )
 
     existing_branch_names = {b["name"] for b in branches}
+    written_nodes: dict[str, dict] = {}
 
     for self_card in future_selves:
         branch_name = hash_id(self_card.name, parent_branch_name, now)
@@ -151,12 +240,15 @@ def _create_memory_branches(
             "branchLabel": branch_name,
             "facts": facts_list,
             "notes": [f"Branch node for: {self_card.name} (parent: {parent_branch_name})"],
-            "selfCard": self_card.model_dump(by_alias=True),
+            "selfCard": (
+                card_dicts[self_card.id]
+                if card_dicts and self_card.id in card_dicts
+                else self_card.model_dump(by_alias=True)
+            ),
             "createdAt": now,
         }
-        (nodes_dir / f"{node_id}.json").write_text(
-            json.dumps(node_data, indent=2), encoding="utf-8"
-        )
+        write_json_atomic(nodes_dir / f"{node_id}.json", node_data)
+        written_nodes[node_id] = node_data
 
         branches.append(
             {
@@ -167,20 +259,112 @@ def _create_memory_branches(
         )
         existing_branch_names.add(branch_name)
 
-    branches_file.write_text(json.dumps(branches, indent=2), encoding="utf-8")
+    write_json_atomic(branches_file, branches)
     session_data["memoryBranches"] = branches
 
     # Keep session_data["memoryNodes"] in sync (inline array mirrors files)
     if "memoryNodes" not in session_data:
         session_data["memoryNodes"] = []
     existing_node_ids = {n["id"] for n in session_data["memoryNodes"]}
-    for node_file in nodes_dir.glob("*.json"):
-        node = json.loads(node_file.read_text(encoding="utf-8"))
+    # Node files are named <node_id>.json: skip mirrored ones without reading
+    # them, and reuse the dicts just written instead of parsing them back.
+    for node_file in iter_node_files(nodes_dir):
+        if node_file.stem in existing_node_ids:
+            continue
+        node = written_nodes.get(node_file.stem) or load_json_bytes(
+            node_file.read_bytes()
+        )
         if node["id"] not in existing_node_ids:
             session_data["memoryNodes"].append(node)
             existing_node_ids.add(node["id"])
 
 
+def _commit_generated_selves(
+    *,
+    session_id: str,
+    storage_path: str,
+    future_selves: list[SelfCard],
+    parent_self_id: str | None,
+    parent_key: str,
+    parent_node_id: str,
+    parent_branch_name: str,
+    level_desc: str,
+) -> float:
+    """
+    Record freshly generated selves in session.json, memory and transcript.
+
+    Re-reads the session rather than trusting the copy loaded before the LLM
+    call; callers hold session_write_lock. Returns the commit timestamp.
+    """
+    session_data = _load_session(session_id, storage_path)
+    session_data.setdefault("futureSelvesFull", {})
+    session_data.setdefault("explorationPaths", {})
+    session_data.pop("memoryTreePending", None)  # materialized in step 2
+
+    # 6. Update parent's children_ids (non-root only)
+    if parent_self_id and parent_self_id in session_data["futureSelvesFull"]:
+        existing_children = session_data["futureSelvesFull"][parent_self_id].get("childrenIds", [])
+        session_data["futureSelvesFull"][parent_self_id]["childrenIds"] = [
+            *existing_children,
+            *[s.id for s in future_selves],
+        ]
+
+    # 7. Update session tree structures
+    now = time.time()
+
+    # Dump each card once; the same dict backs futureSelvesFull,
+    # futureSelfOptions and the memory node, none of which is mutated here.
+    card_dicts = {s.id: s.model_dump(by_alias=True) for s in future_selves}
+
+    # Add to full tree (preserves all selves)
+    session_data["futureSelvesFull"].update(card_dicts)
+
+    # Track exploration path
+    if parent_key not in session_data["explorationPaths"]:
+        session_data["explorationPaths"][parent_key] = []
+    session_data["explorationPaths"][parent_key].extend([s.id for s in future_selves])
+
+    # Update futureSelfOptions (backward compat — only root level)
+    if parent_self_id is None:
+        session_data["futureSelfOptions"] = [card_dicts[s.id] for s in future_selves]
+        session_data["status"] = "selection"
+
+    session_data["updatedAt"] = now
+
+    # 8. Create memory branch nodes
+    _create_memory_branches(
+        session_id=session_id,
+        storage_path=storage_path,
+        future_selves=future_selves,
+        parent_node_id=parent_node_id,
+        parent_branch_name=parent_branch_name,
+        now=now,
+        session_data=session_data,
+        card_dicts=card_dicts,
+    )
+
+    # 9. Persist updated session
+    _save_session(session_id, storage_path, session_data)
+
+    # 10. Append system transcript entry
+    self_names = ", ".join(s.name for s in future_selves)
+    _append_transcript_entry(
+        session_id,
+        storage_path,
+        {
+            "id": hash_id(f"te_{self_names}", session_id, now),
+            "turn": len(session_data.get("transcript", [])) + 1,
+            "phase": "selection",
+            "role": "system",
+            "selfName": None,
+            "content": f"Generated {len(future_selves)} futures ({level_desc}): {self_names}",
+            "timestamp": now,
+        },
+    )
+
+    return now
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -203,13 +387,18 @@ async def generate_future_selves(
     Tree structure preserved in session — nothing is ever lost.
     """
     # 1. Load session from disk
-    session_data = _load_session(request.session_id, settings.storage_path)
+    session_data = await asyncio.to_thread(
+        _load_session, request.session_id, settings.storage_path
+    )
 
     # 2. Initialize tree structures if not present
     if "futureSelvesFull" not in session_data:
         session_data["futureSelvesFull"] = {}
     if "explorationPaths" not in session_data:
         session_data["explorationPaths"] = {}
+    await asyncio.to_thread(
+        _ensure_memory_tree, request.session_id, settings.storage_path, session_data
+    )
 
     # 3. Validate preconditions
     raw_profile = session_data.get("userProfile")
@@ -232,7 +421,9 @@ async def generate_future_selves(
     if request.parent_self_id is None:
         # --- ROOT LEVEL ---
         parent_key = "root"
-        parent_node_id = _find_root_node_id(request.session_id, settings.storage_path)
+        parent_node_id = await asyncio.to_thread(
+            _find_root_node_id, request.session_id, settings.storage_path
+        )
         parent_branch_name = "root"
         level_desc = "root level"
 
@@ -256,14 +447,17 @@ async def generate_future_selves(
         parent_self = SelfCard.model_validate(parent_self_data)
 
         parent_key = request.parent_self_id
-        parent_node_id = _find_node_id_for_self(
-            request.session_id, settings.storage_path, request.parent_self_id
+        parent_node_id = await asyncio.to_thread(
+            _find_node_id_for_self,
+            request.session_id,
+            settings.storage_path,
+            request.parent_self_id,
         )
         # Look up the branch name that was stored when this self was generated
         try:
             _res = ContextResolver(storage_root=settings.storage_path)
-            parent_branch_name = _res.find_branch_for_self(
-                request.session_id, request.parent_self_id
+            parent_branch_name = await asyncio.to_thread(
+                _res.find_branch_for_self, request.session_id, request.parent_self_id
             )
         except ContextResolutionError as exc:
             raise HTTPException(
@@ -273,22 +467,39 @@ async def generate_future_selves(
 
         # Analyze transcript right before re-branching so the latest conversation
         # signals are reflected in memory and downstream generation context.
+        # Only the write-back rewrites session.json, so only it takes the lock;
+        # a concurrent generation's commit cannot be overwritten by it.
         try:
-            analyze_and_persist_transcript_insights(
+            insights = await asyncio.to_thread(
+                extract_transcript_insights,
                 session_id=request.session_id,
                 storage_root=settings.storage_path,
                 branch_name=parent_branch_name,
                 self_id=request.parent_self_id,
-                self_name=parent_self.name,
                 api_key=settings.mistral_api_key,
+                cache_dir=Path(settings.llm_cache_path),
             )
+            if insights is not None:
+                async with session_write_lock(settings.storage_path, request.session_id):
+                    await asyncio.to_thread(
+                        persist_transcript_insights,
+                        session_id=request.session_id,
+                        storage_root=settings.storage_path,
+                        branch_name=parent_branch_name,
+                        self_id=request.parent_self_id,
+                        self_name=parent_self.name,
+                        insights=insights,
+                    )
         except Exception:
             # Best-effort enrichment: generation still proceeds if extraction fails.
             pass
 
         # Resolve ancestor chain + conversation excerpts
-        ancestor_summary, conversation_excerpts = resolve_ancestor_context(
-            request.session_id, request.parent_self_id, settings.storage_path
+        ancestor_summary, conversation_excerpts = await asyncio.to_thread(
+            resolve_ancestor_context,
+            request.session_id,
+            request.parent_self_id,
+            settings.storage_path,
         )
 
         # Default time horizon adapts by depth
@@ -310,7 +521,7 @@ async def generate_future_selves(
 
     # 5. Generate
     try:
-        future_selves = await _get_generator().generate(ctx)
+        future_selves = await _get_generator(settings).generate(ctx)
     except ValueError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -318,64 +529,20 @@ async def generate_future_selves(
     avatar_gen = AvatarGenerator()
     future_selves = await avatar_gen.generate_all(future_selves, request.session_id)
 
-    # 6. Update parent's children_ids (non-root only)
-    if request.parent_self_id and request.parent_self_id in session_data["futureSelvesFull"]:
-        existing_children = session_data["futureSelvesFull"][request.parent_self_id].get("childrenIds", [])
-        session_data["futureSelvesFull"][request.parent_self_id]["childrenIds"] = [
-            *existing_children,
-            *[s.id for s in future_selves],
-        ]
-
-    # 7. Update session tree structures
-    now = time.time()
-
-    # Add to full tree (preserves all selves)
-    for self_card in future_selves:
-        session_data["futureSelvesFull"][self_card.id] = self_card.model_dump(by_alias=True)
-
-    # Track exploration path
-    if parent_key not in session_data["explorationPaths"]:
-        session_data["explorationPaths"][parent_key] = []
-    session_data["explorationPaths"][parent_key].extend([s.id for s in future_selves])
-
-    # Update futureSelfOptions (backward compat — only root level)
-    if request.parent_self_id is None:
-        session_data["futureSelfOptions"] = [
-            s.model_dump(by_alias=True) for s in future_selves
-        ]
-        session_data["status"] = "selection"
-
-    session_data["updatedAt"] = now
-
-    # 8. Create memory branch nodes
-    _create_memory_branches(
-        session_id=request.session_id,
-        storage_path=settings.storage_path,
-        future_selves=future_selves,
-        parent_node_id=parent_node_id,
-        parent_branch_name=parent_branch_name,
-        now=now,
-        session_data=session_data,
-    )
-
-    # 9. Persist updated session
-    _save_session(request.session_id, settings.storage_path, session_data)
-
-    # 10. Append system transcript entry
-    self_names = ", ".join(s.name for s in future_selves)
-    _append_transcript_entry(
-        request.session_id,
-        settings.storage_path,
-        {
-            "id": hash_id(f"te_{self_names}", request.session_id, now),
-            "turn": len(session_data.get("transcript", [])) + 1,
-            "phase": "selection",
-            "role": "system",
-            "selfName": None,
-            "content": f"Generated {len(future_selves)} futures ({level_desc}): {self_names}",
-            "timestamp": now,
-        },
-    )
+    # 6-10. Commit under the session lock; the copy loaded above may be
+    # stale after the LLM await.
+    async with session_write_lock(settings.storage_path, request.session_id):
+        now = await asyncio.to_thread(
+            _commit_generated_selves,
+            session_id=request.session_id,
+            storage_path=settings.storage_path,
+            future_selves=future_selves,
+            parent_self_id=request.parent_self_id,
+            parent_key=parent_key,
+            parent_node_id=parent_node_id,
+            parent_branch_name=parent_branch_name,
+            level_desc=level_desc,
+        )
 
     return GenerateFutureSelvesResponse(
         session_id=request.session_id,
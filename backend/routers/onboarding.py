@@ -19,10 +19,11 @@ from __future__ import annotations
 import asyncio
 import base64
 import binascii
-import json
+import contextlib
 import time
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, AsyncGenerator, Iterator
+from typing import Any, AsyncGenerator, Callable, Iterator
 
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
@@ -31,6 +32,7 @@ from mistralai import Mistral
 from backend.config.runtime import get_runtime_config
 from backend.config.settings import get_settings
 from backend.engines.avatar_generator import AvatarGenerator
+from backend.engines.bounded_cache import BoundedCache
 from backend.engines.current_self_auto_generator import (
     CurrentSelfAutoGeneratorEngine,
     CurrentSelfGenerationContext,
@@ -39,6 +41,7 @@ from backend.engines.elevenlabs_voice import (
     ElevenLabsInterviewVoiceService,
     ElevenLabsVoiceError,
 )
+from backend.engines.json_io import load_json_bytes, sse_event, write_json_atomic
 from backend.engines.profile_extractor import (
     ExtractionContext,
     ProfileExtractorEngine,
@@ -53,9 +56,9 @@ from backend.models.schemas import (
     InterviewTranscribeResponse,
     InterviewTtsRequest,
     InterviewStatusResponse,
-    SelfCard,
     UserProfile,
 )
+from backend.routers.future_self import session_write_lock
 
 
 # ---------------------------------------------------------------------------
@@ -75,72 +78,14 @@ def _load_session(session_id: str) -> dict[str, Any]:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Session {session_id} not found"
         )
-    with open(path) as f:
-        return json.load(f)
+    return load_json_bytes(path.read_bytes())
 
 
 def _save_session(session_id: str, session_data: dict[str, Any]) -> None:
     """Save session to disk, updating timestamp."""
     session_data["updatedAt"] = time.time()
     path = _get_session_path(session_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(session_data, f, indent=2)
-
-
-def _initialize_memory_tree(session_id: str, current_self: SelfCard) -> None:
-    """
-    Initialize memory tree structure with root node.
-    
-    Creates memory/nodes/ directory and root node with currentSelf.
-    This is called when onboarding completes.
-    """
-    settings = get_settings()
-    session_dir = Path(settings.storage_root) / session_id
-    nodes_dir = session_dir / "memory" / "nodes"
-    nodes_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create root node with currentSelf
-    now = time.time()
-    root_node_id = "root_node"
-    
-    root_node = {
-        "id": root_node_id,
-        "parentId": None,  # Root has no parent
-        "branchLabel": "root",
-        "facts": [
-            {
-                "id": f"fact_{root_node_id}_0",
-                "fact": f"Current self: {current_self.name}",
-                "source": "onboarding",
-                "extractedAt": now,
-            },
-            {
-                "id": f"fact_{root_node_id}_1",
-                "fact": f"Optimization goal: {current_self.optimization_goal}",
-                "source": "onboarding",
-                "extractedAt": now,
-            }
-        ],
-        "notes": ["Root node created during onboarding"],
-        "selfCard": current_self.model_dump(by_alias=True),
-        "createdAt": now,
-    }
-    
-    # Write root node
-    root_node_file = nodes_dir / f"{root_node_id}.json"
-    root_node_file.write_text(json.dumps(root_node, indent=2), encoding="utf-8")
-    
-    # Initialize branches.json with root branch
-    branches_file = session_dir / "memory" / "branches.json"
-    branches = [
-        {
-            "name": "root",
-            "headNodeId": root_node_id,
-            "parentBranchName": None,
-        }
-    ]
-    branches_file.write_text(json.dumps(branches, indent=2), encoding="utf-8")
+    write_json_atomic(path, session_data)
 
 
 # ---------------------------------------------------------------------------
@@ -149,6 +94,15 @@ def _initialize_memory_tree(session_id: str, current_self: SelfCard) -> None:
 
 _INTERVIEW_HISTORIES: dict[str, list[dict[str, str]]] = {}
 
+def _get_session_lock(session_id: str) -> asyncio.Lock:
+    """
+    Return the session.json write lock for a session.
+
+    This is the same lock future-self generation and the pipeline take, so an
+    interview turn never interleaves its read-extract-write with theirs.
+    """
+    return session_write_lock(get_settings().storage_root, session_id)
+
 
 def _load_interview_system_prompt() -> str:
     """Load interview agent system prompt from prompts/interview_agent.md."""
@@ -208,57 +162,65 @@ def _normalize_agent_content(content: Any) -> str:
     return ""
 
 
+_HANDOFF_MARKERS = (
+    "i'm handing this off",
+    "im handing this off",
+    "i'll pass this along",
+    "ill pass this along",
+    "i've got a solid picture",
+    "ive got a solid picture",
+    "build out your future scenarios",
+)
+
+_FOLLOWUP_NO_PROFILE = (
+    "Before I hand this off, I need one more detail to personalize your scenarios. "
+    "When you're making high-stakes decisions, what value matters most to you?"
+)
+_FOLLOWUP_VALUES = (
+    "Before I hand this off, one key piece is still missing. "
+    "What matters most to you in this decision right now—security, growth, stability, impact, or something else?"
+)
+_FOLLOWUP_DECISION_STYLE = (
+    "I want one more signal before we hand this off. "
+    "When you face a big decision like this, do you usually move fast and trust your gut, or slow down and analyze every trade-off?"
+)
+_FOLLOWUP_MONEY_MINDSET = (
+    "Before we hand off, I need your money lens on this. "
+    "In this choice, are you more focused on immediate stability or on taking financial risk for long-term upside?"
+)
+_FOLLOWUP_RELATIONSHIPS = (
+    "Before we hand this off, one more context piece helps a lot. "
+    "Who else is most affected by this decision, and how much weight does their situation carry for you?"
+)
+_FOLLOWUP_CONSTRAINT = (
+    "I can hand this off in a second, but one last detail will make the scenarios sharper. "
+    "What's the biggest constraint that makes this decision hard right now?"
+)
+
+# Evaluated in order; the first gap found picks the follow-up question.
+_DEEPENING_FOLLOWUPS: tuple[tuple[Callable[[UserProfile], bool], str], ...] = (
+    (lambda p: not p.core_values and not p.personal.personal_values, _FOLLOWUP_VALUES),
+    (lambda p: not p.decision_style and not p.self_narrative, _FOLLOWUP_DECISION_STYLE),
+    (lambda p: not p.financial.money_mindset, _FOLLOWUP_MONEY_MINDSET),
+    (lambda p: not p.personal.relationships, _FOLLOWUP_RELATIONSHIPS),
+)
+
+
 def _is_handoff_style_message(message: str) -> bool:
     """Detect interview-closing language that should be blocked when profile is sparse."""
     text = message.lower().strip()
-    markers = (
-        "i'm handing this off",
-        "im handing this off",
-        "i'll pass this along",
-        "ill pass this along",
-        "i've got a solid picture",
-        "ive got a solid picture",
-        "build out your future scenarios",
-    )
-    return any(marker in text for marker in markers)
+    return any(marker in text for marker in _HANDOFF_MARKERS)
 
 
 def _build_deepening_followup(profile: UserProfile | None) -> str:
     """Build one focused follow-up question to gather missing high-value signal."""
     if not profile:
-        return (
-            "Before I hand this off, I need one more detail to personalize your scenarios. "
-            "When you're making high-stakes decisions, what value matters most to you?"
-        )
-
-    if not profile.core_values and not profile.personal.personal_values:
-        return (
-            "Before I hand this off, one key piece is still missing. "
-            "What matters most to you in this decision right now—security, growth, stability, impact, or something else?"
-        )
+        return _FOLLOWUP_NO_PROFILE
 
-    if not profile.decision_style and not profile.self_narrative:
-        return (
-            "I want one more signal before we hand this off. "
-            "When you face a big decision like this, do you usually move fast and trust your gut, or slow down and analyze every trade-off?"
-        )
-
-    if not profile.financial.money_mindset:
-        return (
-            "Before we hand off, I need your money lens on this. "
-            "In this choice, are you more focused on immediate stability or on taking financial risk for long-term upside?"
-        )
-
-    if not profile.personal.relationships:
-        return (
-            "Before we hand this off, one more context piece helps a lot. "
-            "Who else is most affected by this decision, and how much weight does their situation carry for you?"
-        )
-
-    return (
-        "I can hand this off in a second, but one last detail will make the scenarios sharper. "
-        "What's the biggest constraint that makes this decision hard right now?"
-    )
+    for is_missing, followup in _DEEPENING_FOLLOWUPS:
+        if is_missing(profile):
+            return followup
+    return _FOLLOWUP_CONSTRAINT
 
 
 def _apply_handoff_blocker(
@@ -267,9 +229,9 @@ def _apply_handoff_blocker(
     profile: UserProfile | None,
 ) -> str:
     """Prevent handoff-style closing when profile completeness is below 50%."""
-    if profile_completeness < 0.5 and _is_handoff_style_message(agent_message):
-        return _build_deepening_followup(profile)
-    return agent_message
+    if profile_completeness >= 0.5 or not _is_handoff_style_message(agent_message):
+        return agent_message
+    return _build_deepening_followup(profile)
 
 
 def _require_voice_enabled() -> None:
@@ -441,18 +403,8 @@ async def _run_extraction_in_background(
         extraction_result = await profile_extractor.extract(extraction_ctx)
         
         # Update session with extracted profile
-        session_data["userProfile"] = extraction_result.extracted_profile.model_dump(mode="json")
-        session_data["transcript"] = [
-            {
-                "id": f"te_{i:03d}",
-                "turn": i + 1,
-                "phase": "interview",
-                "role": msg.get("role", "assistant"),
-                "content": msg.get("content", ""),
-                "timestamp": time.time(),
-            }
-            for i, msg in enumerate(interview_history)
-        ]
+        _store_profile(session_data, extraction_result.extracted_profile)
+        session_data["transcript"] = _interview_transcript(interview_history)
         _save_session(session_id, session_data)
         
         return {
@@ -494,19 +446,21 @@ async def start_interview(request: InterviewStartRequest) -> dict[str, Any]:
     session_path = _get_session_path(request.session_id)
     
     # Load or create session document
-    if session_path.exists():
+    created_new = not session_path.exists()
+    if not created_new:
         session_data = _load_session(request.session_id)
         existing_profile = UserProfile(**session_data.get("userProfile", {})) if session_data.get("userProfile") else None
     else:
         # Create new session
+        now = time.time()
         session_data = {
             "id": request.session_id,
             "status": "onboarding",
             "transcript": [],
             "userProfile": None,
             "currentSelf": None,
-            "createdAt": time.time(),
-            "updatedAt": time.time(),
+            "createdAt": now,
+            "updatedAt": now,
         }
         existing_profile = None
     
@@ -517,8 +471,9 @@ async def start_interview(request: InterviewStartRequest) -> dict[str, Any]:
         existing_profile=existing_profile,
     )
     
-    # Save session data
-    _save_session(request.session_id, session_data)
+    # Resumed sessions are untouched here; only persist a freshly created one
+    if created_new:
+        _save_session(request.session_id, session_data)
     
     # Return greeting
     greeting = interview_history[-1]["content"] if interview_history else "Hello!"
@@ -544,80 +499,70 @@ async def interview_reply(request: InterviewReplyRequest) -> InterviewReplyRespo
     
     NOTE: For streaming responses, use /reply-stream endpoint instead.
     """
-    # Get interview session (or create if first time)
-    if request.session_id not in _INTERVIEW_HISTORIES:
-        _initialize_interview_session(
-            session_id=request.session_id,
-            user_name="User",
-            existing_profile=None,
-        )
-
-    interview_history = _INTERVIEW_HISTORIES[request.session_id]
-    
-    # Load current session data
-    session_data = _load_session(request.session_id)
+    async with _get_session_lock(request.session_id):
+        # Get interview session (or create if first time)
+        interview_history = _INTERVIEW_HISTORIES.get(request.session_id)
+        if interview_history is None:
+            interview_history = _initialize_interview_session(
+                session_id=request.session_id,
+                user_name="User",
+                existing_profile=None,
+            )
     
-    # Get interview agent response
-    try:
-        agent_message = await _generate_interview_reply(interview_history, request.user_message)
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Interview agent error: {str(exc)}"
-        )
+        # Load current session data
+        session_data = _load_session(request.session_id)
     
-    # Build transcript for profile extraction
-    # (combine existing transcript + new user/agent turns)
-    transcript_history = [
-        {"role": msg.get("role", ""), "content": msg.get("content", "")}
-        for msg in interview_history
-    ]
+        # Get interview agent response
+        try:
+            agent_message = await _generate_interview_reply(interview_history, request.user_message)
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Interview agent error: {str(exc)}"
+            )
     
-    # Extract profile
-    profile_extractor = ProfileExtractorEngine()
-    extraction_ctx = ExtractionContext(
-        session_id=request.session_id,
-        transcript_history=transcript_history,
-        current_profile=UserProfile(**session_data["userProfile"]) if session_data.get("userProfile") else None,
-    )
+        # Build transcript for profile extraction
+        # (combine existing transcript + new user/agent turns)
+        transcript_history = [
+            {"role": msg.get("role", ""), "content": msg.get("content", "")}
+            for msg in interview_history
+        ]
     
-    try:
-        extraction_result = await profile_extractor.extract(extraction_ctx)
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Profile extraction error: {str(exc)}"
+        # Extract profile
+        profile_extractor = ProfileExtractorEngine()
+        extraction_ctx = ExtractionContext(
+            session_id=request.session_id,
+            transcript_history=transcript_history,
+            current_profile=UserProfile(**session_data["userProfile"]) if session_data.get("userProfile") else None,
         )
+    
+        try:
+            extraction_result = await profile_extractor.extract(extraction_ctx)
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Profile extraction error: {str(exc)}"
+            )
 
-    agent_message = _apply_handoff_blocker(
-        agent_message,
-        extraction_result.profile_completeness,
-        extraction_result.extracted_profile,
-    )
-    if interview_history and interview_history[-1].get("role") == "assistant":
-        interview_history[-1]["content"] = agent_message
+        agent_message = _apply_handoff_blocker(
+            agent_message,
+            extraction_result.profile_completeness,
+            extraction_result.extracted_profile,
+        )
+        if interview_history and interview_history[-1].get("role") == "assistant":
+            interview_history[-1]["content"] = agent_message
     
-    # Update session with extracted profile
-    session_data["userProfile"] = extraction_result.extracted_profile.model_dump(mode="json")
-    session_data["transcript"] = [
-        {
-            "id": f"te_{i:03d}",
-            "turn": i + 1,
-            "phase": "interview",
-            "role": msg.get("role", "assistant"),
-            "content": msg.get("content", ""),
-            "timestamp": time.time(),
-        }
-        for i, msg in enumerate(interview_history)
-    ]
-    _save_session(request.session_id, session_data)
+        # Update session with extracted profile
+        _store_profile(session_data, extraction_result.extracted_profile)
+        session_data["transcript"] = _interview_transcript(interview_history)
+        _save_session(request.session_id, session_data)
     
-    return InterviewReplyResponse(
-        session_id=request.session_id,
-        agent_message=agent_message,
-        profile_completeness=extraction_result.profile_completeness,
-        extracted_fields=extraction_result.extracted_fields,
-    )
+        return InterviewReplyResponse(
+            session_id=request.session_id,
+            agent_message=agent_message,
+            profile_completeness=extraction_result.profile_completeness,
+            extracted_fields=extraction_result.extracted_fields,
+        )
 
 
 @router.post("/reply-stream")
@@ -674,25 +619,18 @@ async def interview_reply_stream(request: InterviewReplyRequest) -> StreamingRes
     }
     ```
     """
-    # Get interview session (or create if first time)
-    if request.session_id not in _INTERVIEW_HISTORIES:
-        _initialize_interview_session(
-            session_id=request.session_id,
-            user_name="User",
-            existing_profile=None,
+    # Fail with a 404 before the stream starts. History and session are read
+    # inside the generator, under the per-session lock.
+    if not _get_session_path(request.session_id).exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session {request.session_id} not found"
         )
-
-    interview_history = _INTERVIEW_HISTORIES[request.session_id]
-    
-    # Load current session data
-    session_data = _load_session(request.session_id)
     
     # Return streaming response with agent message and background extraction
     return StreamingResponse(
         _stream_response_with_extraction_v2(
             session_id=request.session_id,
-            interview_history=interview_history,
-            session_data=session_data,
             user_message=request.user_message,
         ),
         media_type="text/event-stream",
@@ -793,8 +731,6 @@ async def interview_tts(request: InterviewTtsRequest) -> StreamingResponse:
 
 async def _stream_response_with_extraction_v2(
     session_id: str,
-    interview_history: list[dict[str, str]],
-    session_data: dict[str, Any],
     user_message: str,
 ) -> AsyncGenerator[str, None]:
     """
@@ -805,126 +741,120 @@ async def _stream_response_with_extraction_v2(
     - {"type": "chunk", "data": "text chunk"} for agent message chunks
     - {"type": "extraction", "data": {...}} for extraction results
     """
-    profile_before_dict = session_data.get("userProfile") or {}
-    profile_before = UserProfile(**profile_before_dict) if profile_before_dict else None
-    completeness_before = _calculate_completeness(profile_before) if profile_before else 0.0
-
-    # For sessions already at 50%+, keep true token streaming.
-    if completeness_before >= 0.5:
-        extraction_task = asyncio.create_task(
-            _run_extraction_in_background(session_id, interview_history, session_data)
-        )
+    async with _get_session_lock(session_id):
+        # Read history and session under the lock so a turn queued behind
+        # another one sees its writes.
+        interview_history = _INTERVIEW_HISTORIES.get(session_id)
+        if interview_history is None:
+            interview_history = _initialize_interview_session(
+                session_id=session_id,
+                user_name="User",
+                existing_profile=None,
+            )
+        try:
+            session_data = _load_session(session_id)
+        except HTTPException as exc:
+            yield sse_event({'type': 'error', 'data': exc.detail})
+            return
+
+        completeness_before = _get_profile_status(session_id, session_data)[0]
 
+        # For sessions already at 50%+, keep true token streaming.
+        if completeness_before >= 0.5:
+            extraction_task = asyncio.create_task(
+                _run_extraction_in_background(session_id, interview_history, session_data)
+            )
+
+            try:
+                try:
+                    async for chunk in _stream_interview_reply_with_chat_api(interview_history, user_message):
+                        yield sse_event({'type': 'chunk', 'data': chunk})
+                except Exception as exc:
+                    yield sse_event({'type': 'error', 'data': str(exc)})
+                    return
+
+                try:
+                    extraction_result = await asyncio.wait_for(extraction_task, timeout=30.0)
+                    yield sse_event({'type': 'extraction', 'data': extraction_result})
+                except asyncio.TimeoutError:
+                    print(f"Extraction timeout for {session_id}")
+                    yield sse_event({'type': 'extraction_timeout', 'data': {'message': 'Profile extraction is taking longer than expected'}})
+                except Exception as exc:
+                    print(f"Extraction error for {session_id}: {exc}")
+                    yield sse_event({'type': 'extraction_error', 'data': str(exc)})
+
+                yield "data: {\"type\": \"done\"}\n\n"
+                return
+            finally:
+                # The task writes session.json, so it must not outlive the lock
+                # (client disconnect or a failed reply stream).
+                if not extraction_task.done():
+                    extraction_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await extraction_task
+
+        # For sessions below 50%, enforce handoff blocker before any chunk is emitted.
         try:
-            async for chunk in _stream_interview_reply_with_chat_api(interview_history, user_message):
-                yield f"data: {json.dumps({'type': 'chunk', 'data': chunk})}\n\n"
+            agent_message = await _generate_interview_reply(interview_history, user_message)
         except Exception as exc:
-            yield f"data: {json.dumps({'type': 'error', 'data': str(exc)})}\n\n"
+            yield sse_event({'type': 'error', 'data': str(exc)})
             return
 
         try:
-            extraction_result = await asyncio.wait_for(extraction_task, timeout=30.0)
-            yield f"data: {json.dumps({'type': 'extraction', 'data': extraction_result})}\n\n"
+            extraction_result = await asyncio.wait_for(
+                _run_extraction_in_background(session_id, interview_history, session_data),
+                timeout=30.0,
+            )
         except asyncio.TimeoutError:
             print(f"Extraction timeout for {session_id}")
-            yield f"data: {json.dumps({'type': 'extraction_timeout', 'data': {'message': 'Profile extraction is taking longer than expected'}})}\n\n"
+            extraction_result = {
+                "profile_completeness": completeness_before,
+                "extracted_fields": {},
+            }
         except Exception as exc:
             print(f"Extraction error for {session_id}: {exc}")
-            yield f"data: {json.dumps({'type': 'extraction_error', 'data': str(exc)})}\n\n"
-
-        yield "data: {\"type\": \"done\"}\n\n"
-        return
-
-    # For sessions below 50%, enforce handoff blocker before any chunk is emitted.
-    try:
-        agent_message = await _generate_interview_reply(interview_history, user_message)
-    except Exception as exc:
-        yield f"data: {json.dumps({'type': 'error', 'data': str(exc)})}\n\n"
-        return
+            extraction_result = {
+                "profile_completeness": completeness_before,
+                "extracted_fields": {},
+            }
 
-    try:
-        extraction_result = await asyncio.wait_for(
-            _run_extraction_in_background(session_id, interview_history, session_data),
-            timeout=30.0,
+        profile_after_dict = session_data.get("userProfile") or {}
+        profile_after = UserProfile(**profile_after_dict) if profile_after_dict else None
+        blocked_message = _apply_handoff_blocker(
+            agent_message,
+            extraction_result.get("profile_completeness", completeness_before),
+            profile_after,
         )
-    except asyncio.TimeoutError:
-        print(f"Extraction timeout for {session_id}")
-        extraction_result = {
-            "profile_completeness": completeness_before,
-            "extracted_fields": {},
-        }
-    except Exception as exc:
-        print(f"Extraction error for {session_id}: {exc}")
-        extraction_result = {
-            "profile_completeness": completeness_before,
-            "extracted_fields": {},
-        }
 
-    profile_after_dict = session_data.get("userProfile") or {}
-    profile_after = UserProfile(**profile_after_dict) if profile_after_dict else None
-    blocked_message = _apply_handoff_blocker(
-        agent_message,
-        extraction_result.get("profile_completeness", completeness_before),
-        profile_after,
-    )
+        if blocked_message != agent_message:
+            if interview_history and interview_history[-1].get("role") == "assistant":
+                interview_history[-1]["content"] = blocked_message
 
-    if blocked_message != agent_message:
-        if interview_history and interview_history[-1].get("role") == "assistant":
-            interview_history[-1]["content"] = blocked_message
-
-        session_data["transcript"] = [
-            {
-                "id": f"te_{i:03d}",
-                "turn": i + 1,
-                "phase": "interview",
-                "role": msg.get("role", "assistant"),
-                "content": msg.get("content", ""),
-                "timestamp": time.time(),
-            }
-            for i, msg in enumerate(interview_history)
-        ]
-        _save_session(session_id, session_data)
+            session_data["transcript"] = _interview_transcript(interview_history)
+            _save_session(session_id, session_data)
 
-    chunk_size = 24
-    for i in range(0, len(blocked_message), chunk_size):
-        chunk = blocked_message[i:i + chunk_size]
-        yield f"data: {json.dumps({'type': 'chunk', 'data': chunk})}\n\n"
+        chunk_size = 24
+        for i in range(0, len(blocked_message), chunk_size):
+            chunk = blocked_message[i:i + chunk_size]
+            yield sse_event({'type': 'chunk', 'data': chunk})
 
-    yield f"data: {json.dumps({'type': 'extraction', 'data': extraction_result})}\n\n"
-    yield "data: {\"type\": \"done\"}\n\n"
+        yield sse_event({'type': 'extraction', 'data': extraction_result})
+        yield "data: {\"type\": \"done\"}\n\n"
 
 
 @router.get("/status", response_model=InterviewStatusResponse)
 async def interview_status(session_id: str) -> InterviewStatusResponse:
     """Get current interview/profile status."""
     session_data = _load_session(session_id)
-    
-    profile_dict = session_data.get("userProfile", {})
-    profile = UserProfile(**profile_dict) if profile_dict else None
-    
-    if not profile:
-        return InterviewStatusResponse(
-            session_id=session_id,
-            profile_completeness=0.0,
-            extracted_fields={},
-            current_dilemma=None,
-            is_ready_for_generation=False,
-        )
-    
-    # Calculate completeness
-    completeness = _calculate_completeness(profile)
-    
-    # Build extracted fields
-    extracted_fields = _build_extracted_fields(profile)
-    
-    # Check readiness
-    is_ready = _check_readiness(profile)
+    completeness, extracted_fields, is_ready, current_dilemma = _get_profile_status(
+        session_id, session_data
+    )
     
     return InterviewStatusResponse(
         session_id=session_id,
         profile_completeness=completeness,
         extracted_fields=extracted_fields,
-        current_dilemma=profile.current_dilemma,
+        current_dilemma=current_dilemma,
         is_ready_for_generation=is_ready,
     )
 
@@ -986,18 +916,18 @@ async def complete_interview(request: InterviewCompleteRequest) -> InterviewComp
         gen_result.current_self = updated_selves[0]
     
     # Save to session
-    session_data["userProfile"] = profile.model_dump(mode="json")
+    _store_profile(session_data, profile)
     session_data["currentSelf"] = gen_result.current_self.model_dump(mode="json")
     session_data["status"] = "ready_for_future_self_generation"
     
-    # Initialize memory tree structure with root node
-    _initialize_memory_tree(request.session_id, gen_result.current_self)
+    # Memory tree is built lazily when exploration starts
+    session_data["memoryTreePending"] = True
     
     _save_session(request.session_id, session_data)
     
     # Clear interview session from cache
-    if request.session_id in _INTERVIEW_HISTORIES:
-        del _INTERVIEW_HISTORIES[request.session_id]
+    _INTERVIEW_HISTORIES.pop(request.session_id, None)
+    _PROFILE_STATUS_CACHE.pop(request.session_id, None)
     
     return InterviewCompleteResponse(
         session_id=request.session_id,
@@ -1012,73 +942,154 @@ async def complete_interview(request: InterviewCompleteRequest) -> InterviewComp
 # Helper functions
 # ---------------------------------------------------------------------------
 
+# Profile status only changes when _save_session bumps updatedAt, so memoize
+# it per session on that stamp and skip re-validating the profile on polls.
+# session_id -> (updatedAt, status); bounded because abandoned interviews
+# never reach /complete, which is the only place entries are dropped.
+_PROFILE_STATUS_CACHE = BoundedCache(256)
+
+
+def _get_profile_status(
+    session_id: str,
+    session_data: dict[str, Any],
+) -> tuple[float, dict[str, bool], bool, str | None]:
+    """Return (completeness, extracted_fields, is_ready, current_dilemma) for a session."""
+    updated_at = session_data.get("updatedAt")
+    cached = _PROFILE_STATUS_CACHE.get(session_id)
+    if cached is not None and updated_at is not None and cached[0] == updated_at:
+        return cached[1]
+
+    profile_dict = session_data.get("userProfile") or {}
+    if profile_dict:
+        profile = UserProfile(**profile_dict)
+        filled_mask = _filled_field_mask(profile)
+        result = (
+            _completeness_from_mask(filled_mask),
+            _extracted_fields_from_mask(filled_mask),
+            _check_readiness(profile),
+            profile.current_dilemma,
+        )
+    else:
+        result = (0.0, {}, False, None)
+
+    if updated_at is not None:
+        _PROFILE_STATUS_CACHE.put(session_id, (updated_at, result))
+    return result
+
+
+# Profile fields counted toward completeness, as (key, getter) pairs.
+_COMPLETENESS_FIELDS: tuple[tuple[str, attrgetter], ...] = tuple(
+    (path.rsplit(".", 1)[-1], attrgetter(path))
+    for path in (
+        "core_values",
+        "fears",
+        "hidden_tensions",
+        "decision_style",
+        "self_narrative",
+        "current_dilemma",
+        "career.job_title",
+        "career.career_goal",
+        "financial.income_level",
+        "financial.money_mindset",
+        "personal.relationships",
+        "personal.hobbies",
+        "personal.personal_values",
+        "health.mental_health",
+        "health.physical_health",
+        "life_situation.current_location",
+        "life_situation.life_stage",
+    )
+)
+
+# Denominator is deliberately larger than the tracked field count: the 50%
+# onboarding gate is calibrated against it.
+_COMPLETENESS_TOTAL_FIELDS = 20
+
+# Subset of tracked fields surfaced to the UI as extractedFields.
+_EXTRACTED_FIELD_KEYS = frozenset({
+    "core_values",
+    "fears",
+    "hidden_tensions",
+    "decision_style",
+    "self_narrative",
+    "current_dilemma",
+    "job_title",
+    "career_goal",
+    "income_level",
+    "money_mindset",
+    "relationships",
+    "hobbies",
+    "life_stage",
+})
+
+# (key, bit) pairs for the extractedFields subset, bit positions follow _COMPLETENESS_FIELDS.
+_EXTRACTED_FIELD_BITS: tuple[tuple[str, int], ...] = tuple(
+    (key, 1 << bit)
+    for bit, (key, _) in enumerate(_COMPLETENESS_FIELDS)
+    if key in _EXTRACTED_FIELD_KEYS
+)
+
+
+def _interview_transcript(interview_history: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Rebuild the interview transcript; every entry shares one timestamp for this save."""
+    now = time.time()
+    return [
+        {
+            "id": f"te_{i:03d}",
+            "turn": i + 1,
+            "phase": "interview",
+            "role": msg.get("role", "assistant"),
+            "content": msg.get("content", ""),
+            "timestamp": now,
+        }
+        for i, msg in enumerate(interview_history)
+    ]
+
+
+def _store_profile(session_data: dict[str, Any], profile: UserProfile) -> None:
+    """
+    Write the profile into the session document together with its completeness.
+
+    The stored ``profileCompleteness`` is for display only; the completion
+    gates recompute it from the profile they are about to accept.
+    """
+    session_data["userProfile"] = profile.model_dump(mode="json")
+    session_data["profileCompleteness"] = _calculate_completeness(profile)
+
+
+def _filled_field_mask(profile: UserProfile) -> int:
+    """Walk the tracked fields once; bit i is set when _COMPLETENESS_FIELDS[i] is filled."""
+    mask = 0
+    for bit, (_, getter) in enumerate(_COMPLETENESS_FIELDS):
+        if getter(profile):
+            mask |= 1 << bit
+    return mask
+
+
+def _completeness_from_mask(filled_mask: int) -> float:
+    return min(1.0, filled_mask.bit_count() / _COMPLETENESS_TOTAL_FIELDS)
+
+
+def _extracted_fields_from_mask(filled_mask: int) -> dict[str, bool]:
+    return {key: bool(filled_mask & bit) for key, bit in _EXTRACTED_FIELD_BITS}
+
+
 def _calculate_completeness(profile: UserProfile) -> float:
     """Calculate profile completeness as 0-1."""
-    total_fields = 20
-    filled_fields = 0
-    
-    if profile.core_values:
-        filled_fields += 1
-    if profile.fears:
-        filled_fields += 1
-    if profile.hidden_tensions:
-        filled_fields += 1
-    if profile.decision_style:
-        filled_fields += 1
-    if profile.self_narrative:
-        filled_fields += 1
-    if profile.current_dilemma:
-        filled_fields += 1
-    if profile.career.job_title:
-        filled_fields += 1
-    if profile.career.career_goal:
-        filled_fields += 1
-    if profile.financial.income_level:
-        filled_fields += 1
-    if profile.financial.money_mindset:
-        filled_fields += 1
-    if profile.personal.relationships:
-        filled_fields += 1
-    if profile.personal.hobbies:
-        filled_fields += 1
-    if profile.personal.personal_values:
-        filled_fields += 1
-    if profile.health.mental_health:
-        filled_fields += 1
-    if profile.health.physical_health:
-        filled_fields += 1
-    if profile.life_situation.current_location:
-        filled_fields += 1
-    if profile.life_situation.life_stage:
-        filled_fields += 1
-    
-    return min(1.0, filled_fields / total_fields)
+    return _completeness_from_mask(_filled_field_mask(profile))
 
 
 def _build_extracted_fields(profile: UserProfile) -> dict[str, bool]:
     """Build extracted_fields dict for UI."""
-    return {
-        "core_values": bool(profile.core_values),
-        "fears": bool(profile.fears),
-        "hidden_tensions": bool(profile.hidden_tensions),
-        "decision_style": bool(profile.decision_style),
-        "self_narrative": bool(profile.self_narrative),
-        "current_dilemma": bool(profile.current_dilemma),
-        "job_title": bool(profile.career.job_title),
-        "career_goal": bool(profile.career.career_goal),
-        "income_level": bool(profile.financial.income_level),
-        "money_mindset": bool(profile.financial.money_mindset),
-        "relationships": bool(profile.personal.relationships),
-        "hobbies": bool(profile.personal.hobbies),
-        "life_stage": bool(profile.life_situation.life_stage),
-    }
+    return _extracted_fields_from_mask(_filled_field_mask(profile))
 
 
 def _check_readiness(profile: UserProfile) -> bool:
     """Check if profile is ready for CurrentSelf generation."""
-    has_dilemma = bool(profile.current_dilemma and len(str(profile.current_dilemma)) > 10)
-    has_psychology = bool(profile.core_values) and bool(profile.fears)
-    has_narrative = bool(profile.self_narrative) or bool(
-        profile.decision_style and profile.hidden_tensions
-    )
-    return bool(has_dilemma and has_psychology and has_narrative)
+    # Cheapest and most often missing checks first; the dilemma length check runs last.
+    if not (profile.core_values and profile.fears):
+        return False
+    if not (profile.self_narrative or (profile.decision_style and profile.hidden_tensions)):
+        return False
+    # current_dilemma is typed str, so no str() conversion is needed
+    return len(profile.current_dilemma) > 10
@@ -12,7 +12,9 @@ These endpoints wrap PipelineOrchestrator methods with proper HTTP semantics.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
@@ -30,12 +32,28 @@ from backend.models.schemas import SelfCard, UserProfile
 router = APIRouter(prefix="/pipeline", tags=["pipeline"])
 
 
+@lru_cache(maxsize=None)
+def _orchestrator_for(storage_root: str) -> PipelineOrchestrator:
+    return PipelineOrchestrator(storage_root=storage_root)
+
+
+def get_orchestrator(settings: Settings = Depends(get_settings)) -> PipelineOrchestrator:
+    """Shared orchestrator per storage root; it holds no per-request state."""
+    return _orchestrator_for(settings.storage_root)
+
+
 # ---------------------------------------------------------------------------
 # Request/Response models
 # ---------------------------------------------------------------------------
 
 def _camel_config() -> ConfigDict:
-    return ConfigDict(alias_generator=to_camel, populate_by_name=True)
+    # Pipeline payloads are built once and never mutated; unknown keys are client bugs.
+    return ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        frozen=True,
+        extra="forbid",
+    )
 
 
 class CompleteOnboardingRequest(BaseModel):
@@ -120,7 +138,7 @@ class PipelineStatusResponse(BaseModel):
 @router.post("/complete-onboarding", response_model=CompleteOnboardingResponse)
 async def complete_onboarding(
     request: CompleteOnboardingRequest,
-    settings: Settings = Depends(get_settings),
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
 ) -> CompleteOnboardingResponse:
     """
     Complete onboarding and generate CurrentSelf.
@@ -134,8 +152,6 @@ async def complete_onboarding(
 
     Returns CurrentSelf and updated UserProfile.
     """
-    orchestrator = PipelineOrchestrator(storage_root=settings.storage_root)
-
     try:
         profile, current_self = await orchestrator.complete_onboarding_flow(
             session_id=request.session_id,
@@ -162,7 +178,7 @@ async def complete_onboarding(
 @router.post("/start-exploration", response_model=InitializeExplorationResponse)
 async def start_exploration(
     request: InitializeExplorationRequest,
-    settings: Settings = Depends(get_settings),
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
 ) -> InitializeExplorationResponse:
     """
     Generate root-level future selves and initialize memory tree.
@@ -176,8 +192,6 @@ async def start_exploration(
 
     Use /conversation/reply to start conversing with a chosen future self.
     """
-    orchestrator = PipelineOrchestrator(storage_root=settings.storage_root)
-
     try:
         future_selves = await orchestrator.initialize_exploration(
             session_id=request.session_id,
@@ -203,7 +217,7 @@ async def start_exploration(
 @router.post("/branch-conversation", response_model=BranchFromConversationResponse)
 async def branch_conversation(
     request: BranchFromConversationRequest,
-    settings: Settings = Depends(get_settings),
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
 ) -> BranchFromConversationResponse:
     """
     Generate deeper future selves from conversation context.
@@ -218,10 +232,8 @@ async def branch_conversation(
 
     Creates child branches that inherit context from parent path.
     """
-    orchestrator = PipelineOrchestrator(storage_root=settings.storage_root)
-
     try:
-        child_selves = await orchestrator.branch_from_conversation(
+        parent_self, child_selves = await orchestrator.branch_from_conversation(
             session_id=request.session_id,
             parent_self_id=request.parent_self_id,
             num_futures=request.num_futures,
@@ -237,11 +249,6 @@ async def branch_conversation(
             detail=str(exc),
         ) from exc
 
-    # Get parent self name from session
-    session_data = orchestrator._load_session(request.session_id)
-    future_selves_full = session_data.get("futureSelvesFull", {})
-    parent_self = SelfCard(**future_selves_full[request.parent_self_id])
-
     return BranchFromConversationResponse(
         session_id=request.session_id,
         parent_self_id=request.parent_self_id,
@@ -295,7 +302,7 @@ async def upload_user_photo(
 @router.get("/status/{session_id}", response_model=PipelineStatusResponse)
 async def get_pipeline_status(
     session_id: str,
-    settings: Settings = Depends(get_settings),
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
 ) -> PipelineStatusResponse:
     """
     Get current pipeline state and available actions.
@@ -311,10 +318,8 @@ async def get_pipeline_status(
 
     Use this to determine which pipeline endpoints are available.
     """
-    orchestrator = PipelineOrchestrator(storage_root=settings.storage_root)
-
     try:
-        status_data = orchestrator.get_pipeline_status(session_id)
+        status_data = await asyncio.to_thread(orchestrator.get_pipeline_status, session_id)
     except PipelineOrchestratorError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
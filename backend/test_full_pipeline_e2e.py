@@ -15,6 +15,7 @@ all components work together correctly.
 Usage:
     python backend/test_full_pipeline_e2e.py
     python backend/test_full_pipeline_e2e.py --keep-session
+    python backend/test_full_pipeline_e2e.py --fast
 """
 
 from __future__ import annotations
@@ -22,17 +23,25 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import os
 import sys
 import time
 import uuid
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speedup; stdlib json is used when unavailable.
+
 # Add backend to path for standalone execution
 if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from backend.config.settings import get_settings
+from backend.config.settings import Settings, get_settings
 from backend.engines.pipeline_orchestrator import (
     InvalidStateError,
     PipelineOrchestrator,
@@ -46,7 +55,7 @@ from backend.engines import (
     MistralChatConfig,
     PromptComposer,
     PromptComposerConfig,
-    append_conversation_turn,
+    append_conversation_turns,
 )
 from backend.engines.prompt_composer import ChatMessage
 from backend.engines.current_self_auto_generator import (
@@ -73,38 +82,66 @@ except ImportError:
     pass
 
 
+# Stage 3 knobs: TOMORROW_YOU_E2E_PARALLEL_CHAT=1 sends the scripted prompts as
+# independent concurrent probes; TOMORROW_YOU_E2E_TURN_DELAY sets the pause
+# between chained turns.
+_PARALLEL_CHAT = os.getenv("TOMORROW_YOU_E2E_PARALLEL_CHAT", "").strip() == "1"
+_TURN_DELAY_SECONDS = float(os.getenv("TOMORROW_YOU_E2E_TURN_DELAY", "0.5"))
+# TOMORROW_YOU_E2E_VERBOSE=1 prints each assertion immediately instead of per stage.
+_VERBOSE = os.getenv("TOMORROW_YOU_E2E_VERBOSE", "").strip() == "1"
+_PRETTY_JSON = os.getenv("TOMORROW_YOU_PRETTY", "").strip() == "1"
+
+
 # ---------------------------------------------------------------------------
 # Test Utilities
 # ---------------------------------------------------------------------------
 
 class TestResult:
-    """Container for test results."""
+    """Container for test results.
+
+    Passing assertions are buffered and written once per stage via ``flush``;
+    failures are printed immediately (after any buffered lines, to keep order).
+    With ``verbose=True`` every assertion is printed as it happens.
+    """
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.passed = 0
         self.failed = 0
         self.errors: list[str] = []
+        self.verbose = verbose
+        self._pending: list[str] = []
     
     def assert_true(self, condition: bool, message: str) -> None:
         """Assert condition is True."""
         if condition:
-            self.passed += 1
-            print(f"  ✅ {message}")
+            self._pass(message)
         else:
-            self.failed += 1
-            self.errors.append(message)
-            print(f"  ❌ FAIL: {message}")
+            self._fail(message)
     
     def assert_equals(self, actual: Any, expected: Any, message: str) -> None:
         """Assert actual equals expected."""
         if actual == expected:
-            self.passed += 1
-            print(f"  ✅ {message}")
+            self._pass(message)
         else:
-            self.failed += 1
-            error_msg = f"{message} (expected: {expected}, got: {actual})"
-            self.errors.append(error_msg)
-            print(f"  ❌ FAIL: {error_msg}")
+            self._fail(f"{message} (expected: {expected}, got: {actual})")
+    
+    def _pass(self, message: str) -> None:
+        self.passed += 1
+        self._pending.append(f"  ✅ {message}")
+        if self.verbose:
+            self.flush()
+    
+    def _fail(self, error_msg: str) -> None:
+        self.failed += 1
+        self.errors.append(error_msg)
+        self.flush()
+        print(f"  ❌ FAIL: {error_msg}")
+    
+    def flush(self) -> None:
+        """Write buffered passing assertions in one call."""
+        if self._pending:
+            sys.stdout.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
     
     def assert_not_none(self, value: Any, message: str) -> None:
         """Assert value is not None."""
@@ -116,19 +153,105 @@ class TestResult:
     
     def print_summary(self) -> None:
         """Print test summary."""
-        print("\n" + "=" * 70)
-        print("TEST SUMMARY")
-        print("=" * 70)
-        print(f"Passed: {self.passed}")
-        print(f"Failed: {self.failed}")
-        print(f"Total: {self.passed + self.failed}")
-        
+        self.flush()
+        lines = [
+            "",
+            "=" * 70,
+            "TEST SUMMARY",
+            "=" * 70,
+            f"Passed: {self.passed}",
+            f"Failed: {self.failed}",
+            f"Total: {self.passed + self.failed}",
+        ]
         if self.errors:
-            print("\nFailed Assertions:")
-            for error in self.errors:
-                print(f"  - {error}")
-        
-        print("=" * 70 + "\n")
+            lines.append("\nFailed Assertions:")
+            lines.extend(f"  - {error}" for error in self.errors)
+        lines.append("=" * 70 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _dump_json_bytes(payload: Any) -> bytes:
+    """Serialize payload as JSON bytes, using orjson when installed.
+
+    Output is compact unless TOMORROW_YOU_PRETTY=1 is set for local inspection.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if _PRETTY_JSON else 0)
+    if _PRETTY_JSON:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class StubChatClient:
+    """Deterministic stand-in for MistralChatClient used by --fast runs."""
+
+    def __init__(self) -> None:
+        self.counter = 0
+
+    def chat(self, messages: list[ChatMessage]) -> str:
+        self.counter += 1
+        return f"Canned response for turn {self.counter}"
+
+
+@dataclass(frozen=True)
+class ConversationClients:
+    """Conversation dependencies built once per run and shared across stages."""
+
+    resolver: ContextResolver
+    chat_client: MistralChatClient | StubChatClient
+    composer: PromptComposer
+
+
+def build_conversation_clients(settings: Settings, *, fast: bool = False) -> ConversationClients:
+    """Construct the resolver, chat client and prompt composer used by stage 3."""
+    if fast:
+        chat_client: MistralChatClient | StubChatClient = StubChatClient()
+    else:
+        chat_client = MistralChatClient(
+            api_key=settings.mistral_api_key,
+            config=MistralChatConfig(
+                model=settings.mistral_model,
+                temperature=0.7,
+                top_p=0.95,
+                max_tokens=300,
+            ),
+        )
+    return ConversationClients(
+        resolver=ContextResolver(storage_root=settings.storage_root),
+        chat_client=chat_client,
+        composer=PromptComposer(config=PromptComposerConfig()),
+    )
+
+
+@dataclass(frozen=True)
+class SessionPaths:
+    """Filesystem locations for the test session, computed once per run."""
+
+    session_dir: Path
+    memory_dir: Path
+    nodes_dir: Path
+    branches_file: Path
+
+    @classmethod
+    def for_session(cls, storage_root: str | Path, session_id: str) -> SessionPaths:
+        session_dir = Path(storage_root) / session_id
+        memory_dir = session_dir / "memory"
+        return cls(
+            session_dir=session_dir,
+            memory_dir=memory_dir,
+            nodes_dir=memory_dir / "nodes",
+            branches_file=memory_dir / "branches.json",
+        )
+
+
+def _count_json_files(directory: Path) -> int:
+    """Count *.json files without building a Path per entry."""
+    with os.scandir(directory) as entries:
+        return sum(
+            1
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        )
 
 
 def print_stage(stage_num: int, title: str) -> None:
@@ -206,6 +329,17 @@ def create_test_profile() -> UserProfile:
     )
 
 
+@lru_cache(maxsize=1)
+def _base_profile_dict() -> dict[str, Any]:
+    return create_test_profile().model_dump(mode="json")
+
+
+def create_test_profile_dict() -> dict[str, Any]:
+    """JSON-ready test profile with a fresh id; the profile is validated and dumped once."""
+    # Shallow copy: nested values are shared with the cached base and must not be mutated.
+    return {**_base_profile_dict(), "id": f"profile_{uuid.uuid4().hex[:8]}"}
+
+
 # ---------------------------------------------------------------------------
 # Test Stages
 # ---------------------------------------------------------------------------
@@ -214,28 +348,27 @@ async def stage_1_onboarding(
     session_id: str,
     orchestrator: PipelineOrchestrator,
     result: TestResult,
+    paths: SessionPaths,
 ) -> None:
     """Stage 1: Complete onboarding and generate CurrentSelf."""
     print_stage(1, "ONBOARDING → CURRENT SELF GENERATION")
     
-    # Create test profile
-    profile = create_test_profile()
-    
     # Save initial session with profile
-    session_dir = Path(orchestrator.storage_root) / session_id
+    session_dir = paths.session_dir
     session_dir.mkdir(parents=True, exist_ok=True)
     
+    now = time.time()
     session_data = {
         "id": session_id,
         "username": "E2E Test User",
         "status": "onboarding",
-        "userProfile": profile.model_dump(mode="json"),
-        "createdAt": time.time(),
-        "updatedAt": time.time(),
+        "userProfile": create_test_profile_dict(),
+        "createdAt": now,
+        "updatedAt": now,
     }
     
     session_file = session_dir / "session.json"
-    session_file.write_text(json.dumps(session_data, indent=2))
+    session_file.write_bytes(_dump_json_bytes(session_data))
     
     print("📝 Created test session with complete profile")
     
@@ -275,6 +408,7 @@ async def stage_2_root_generation(
     orchestrator: PipelineOrchestrator,
     visualizer: TreeVisualizer,
     result: TestResult,
+    paths: SessionPaths,
 ) -> list[SelfCard]:
     """Stage 2: Generate root-level future selves."""
     print_stage(2, "ROOT FUTURE SELF GENERATION")
@@ -285,11 +419,11 @@ async def stage_2_root_generation(
             num_futures=3,
         )
         
-        print(f"\n✅ Generated {len(future_selves)} root-level future selves:\n")
+        lines = [f"\n✅ Generated {len(future_selves)} root-level future selves:\n"]
         for i, self_card in enumerate(future_selves, 1):
-            print(f"  {i}. {self_card.name} (depth {self_card.depth_level})")
-            print(f"     Goal: {self_card.optimization_goal}")
-        print()
+            lines.append(f"  {i}. {self_card.name} (depth {self_card.depth_level})")
+            lines.append(f"     Goal: {self_card.optimization_goal}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
         
         # Assertions
         result.assert_equals(len(future_selves), 3, "Generated 3 future selves")
@@ -328,16 +462,13 @@ async def stage_2_root_generation(
         )
         
         # Verify memory structures
-        memory_dir = Path(orchestrator.storage_root) / session_id / "memory"
-        nodes_dir = memory_dir / "nodes"
-        branches_file = memory_dir / "branches.json"
-        
-        result.assert_true(nodes_dir.exists(), "Memory nodes directory exists")
-        result.assert_true(branches_file.exists(), "branches.json exists")
+        result.assert_true(paths.nodes_dir.exists(), "Memory nodes directory exists")
+        result.assert_true(paths.branches_file.exists(), "branches.json exists")
         
         # Should have 4 nodes: 1 root + 3 futures
-        node_files = list(nodes_dir.glob("*.json"))
-        result.assert_equals(len(node_files), 4, "Memory tree has 4 nodes (1 root + 3 futures)")
+        result.assert_equals(
+            _count_json_files(paths.nodes_dir), 4, "Memory tree has 4 nodes (1 root + 3 futures)"
+        )
         
         # Verify transcript
         transcript = orchestrator._load_transcript(session_id)
@@ -356,12 +487,14 @@ async def stage_3_conversation(
     target_self: SelfCard,
     orchestrator: PipelineOrchestrator,
     result: TestResult,
+    clients: ConversationClients,
 ) -> list[tuple[str, str]]:
     """Stage 3: Have conversation with selected future self."""
     print_stage(3, f"CONVERSATION WITH {target_self.name.upper()}")
     
-    settings = get_settings()
-    resolver = ContextResolver(storage_root=settings.storage_root)
+    resolver = clients.resolver
+    chat_client = clients.chat_client
+    composer = clients.composer
     
     try:
         branch_name = resolver.find_branch_for_self(session_id, target_self.id)
@@ -369,18 +502,6 @@ async def stage_3_conversation(
         
         print(f"💬 Starting conversation with {target_self.name}\n")
         
-        chat_client = MistralChatClient(
-            api_key=settings.mistral_api_key,
-            config=MistralChatConfig(
-                model=settings.mistral_model,
-                temperature=0.7,
-                top_p=0.95,
-                max_tokens=300,
-            )
-        )
-        
-        composer = PromptComposer(config=PromptComposerConfig())
-        
         # Simulated conversation
         conversation_exchanges = [
             "Hi! Tell me about your typical day.",
@@ -391,13 +512,37 @@ async def stage_3_conversation(
         
         history: list[ChatMessage] = []
         conversation_log: list[tuple[str, str]] = []
+        system_prompt = composer.compose_system_prompt(context)
+        
+        if _PARALLEL_CHAT:
+            # Independent probes: each prompt sees no prior history, so all
+            # turns can be in flight at once.
+            responses = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        chat_client.chat,
+                        composer.compose_messages(
+                            context, user_msg, [], system_prompt=system_prompt
+                        ),
+                    )
+                    for user_msg in conversation_exchanges
+                )
+            )
+        else:
+            responses = None
         
         for i, user_msg in enumerate(conversation_exchanges, 1):
             print(f"[Turn {i}]")
             print(f"User: {user_msg}")
             
-            messages = composer.compose_messages(context, user_msg, history)
-            response = chat_client.chat(messages)
+            if responses is not None:
+                response = responses[i - 1]
+            else:
+                messages = composer.compose_messages(
+                    context, user_msg, history, system_prompt=system_prompt
+                )
+                # The SDK call is blocking; keep the event loop free while it runs.
+                response = await asyncio.to_thread(chat_client.chat, messages)
             
             print(f"{target_self.name}: {response[:100]}{'...' if len(response) > 100 else ''}\n")
             
@@ -405,19 +550,24 @@ async def stage_3_conversation(
             history.append({"role": "assistant", "content": response})
             conversation_log.append((user_msg, response))
             
-            # Persist to transcript
-            append_conversation_turn(
-                session_id=session_id,
-                storage_root=settings.storage_root,
-                user_text=user_msg,
-                assistant_text=response,
-                self_id=target_self.id,
-                self_name=target_self.name,
-                branch_name=branch_name,
-            )
-            
-            # Small delay to avoid rate limits
-            await asyncio.sleep(0.5)
+            # Small delay between API calls to avoid rate limits
+            if (
+                responses is None
+                and not isinstance(chat_client, StubChatClient)
+                and i < len(conversation_exchanges)
+                and _TURN_DELAY_SECONDS > 0
+            ):
+                await asyncio.sleep(_TURN_DELAY_SECONDS)
+        
+        # Persist all turns to the transcript in one write
+        append_conversation_turns(
+            session_id=session_id,
+            storage_root=orchestrator.storage_root,
+            turns=conversation_log,
+            self_id=target_self.id,
+            self_name=target_self.name,
+            branch_name=branch_name,
+        )
         
         print(f"✅ Completed {len(conversation_exchanges)} conversation turns\n")
         
@@ -457,25 +607,30 @@ async def stage_4_secondary_branching(
     orchestrator: PipelineOrchestrator,
     visualizer: TreeVisualizer,
     result: TestResult,
-) -> list[SelfCard]:
-    """Stage 4: Generate secondary future selves from conversation."""
+    paths: SessionPaths,
+) -> tuple[list[SelfCard], dict[str, Any]]:
+    """Stage 4: Generate secondary future selves from conversation.
+
+    Returns the child selves and the post-branching session data so later
+    stages can reuse it instead of re-reading session.json.
+    """
     print_stage(4, "SECONDARY BRANCHING")
     
     print(f"🌿 Generating deeper futures from {parent_self.name}...\n")
     
     try:
-        child_selves = await orchestrator.branch_from_conversation(
+        _, child_selves = await orchestrator.branch_from_conversation(
             session_id=session_id,
             parent_self_id=parent_self.id,
             num_futures=3,
         )
         
-        print(f"\n✅ Generated {len(child_selves)} secondary future selves:\n")
+        lines = [f"\n✅ Generated {len(child_selves)} secondary future selves:\n"]
         for i, self_card in enumerate(child_selves, 1):
-            print(f"  {i}. {self_card.name} (depth {self_card.depth_level})")
-            print(f"     Parent: {parent_self.name}")
-            print(f"     Goal: {self_card.optimization_goal}")
-        print()
+            lines.append(f"  {i}. {self_card.name} (depth {self_card.depth_level})")
+            lines.append(f"     Parent: {parent_self.name}")
+            lines.append(f"     Goal: {self_card.optimization_goal}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
         
         # Assertions
         result.assert_equals(len(child_selves), 3, "Generated 3 child selves")
@@ -515,15 +670,13 @@ async def stage_4_secondary_branching(
         )
         
         # Verify memory nodes created
-        nodes_dir = Path(orchestrator.storage_root) / session_id / "memory" / "nodes"
-        node_files = list(nodes_dir.glob("*.json"))
         result.assert_equals(
-            len(node_files),
+            _count_json_files(paths.nodes_dir),
             7,
             "Memory tree has 7 nodes (1 root + 3 level-1 + 3 level-2)"
         )
         
-        return child_selves
+        return child_selves, session_data
     
     except Exception as exc:
         result.assert_true(False, f"Secondary branching failed: {exc}")
@@ -534,6 +687,7 @@ async def stage_5_tree_navigation(
     session_id: str,
     visualizer: TreeVisualizer,
     parent_self: SelfCard,
+    session_data: dict[str, Any],
     result: TestResult,
 ) -> None:
     """Stage 5: Verify tree structure and navigation."""
@@ -543,15 +697,17 @@ async def stage_5_tree_navigation(
         # Get statistics
         stats = visualizer.get_branch_statistics(session_id)
         
-        print("📊 Tree Statistics:\n")
-        print(f"  Total Future Selves: {stats['total_selves']}")
-        print(f"  Maximum Depth: {stats['max_depth']}")
-        print(f"  Branches with Conversations: {stats['branches_with_conversations']}")
-        print(f"  Total Conversation Turns: {stats['total_conversation_turns']}")
-        print(f"\n  Depth Distribution:")
+        lines = [
+            "📊 Tree Statistics:\n",
+            f"  Total Future Selves: {stats['total_selves']}",
+            f"  Maximum Depth: {stats['max_depth']}",
+            f"  Branches with Conversations: {stats['branches_with_conversations']}",
+            f"  Total Conversation Turns: {stats['total_conversation_turns']}",
+            "\n  Depth Distribution:",
+        ]
         for depth, count in sorted(stats['depth_distribution'].items()):
-            print(f"    Depth {depth}: {count} selves")
-        print()
+            lines.append(f"    Depth {depth}: {count} selves")
+        sys.stdout.write("\n".join(lines) + "\n\n")
         
         # Assertions
         result.assert_equals(stats['total_selves'], 6, "Total of 6 future selves")
@@ -582,10 +738,7 @@ async def stage_5_tree_navigation(
         result.assert_equals(len(branches), 6, "list_available_branches returns 6 branches")
         
         # Test ancestor retrieval
-        session_data_raw = json.loads(
-            (Path(visualizer.storage_root) / session_id / "session.json").read_text()
-        )
-        child_ids = session_data_raw["futureSelvesFull"][parent_self.id].get("childrenIds", [])
+        child_ids = session_data["futureSelvesFull"][parent_self.id].get("childrenIds", [])
         
         if child_ids:
             first_child_id = child_ids[0]
@@ -615,8 +768,12 @@ async def stage_5_tree_navigation(
 # Main Test Runner
 # ---------------------------------------------------------------------------
 
-async def run_full_pipeline_test(keep_session: bool = False) -> int:
-    """Run complete E2E test."""
+async def run_full_pipeline_test(keep_session: bool = False, fast: bool = False) -> int:
+    """Run complete E2E test.
+
+    With ``fast``, stage 3 talks to a canned StubChatClient instead of Mistral;
+    onboarding and branching generation still call the real models.
+    """
     print("\n" + "=" * 70)
     print("TOMORROW YOU - FULL PIPELINE E2E TEST")
     print("=" * 70 + "\n")
@@ -628,28 +785,36 @@ async def run_full_pipeline_test(keep_session: bool = False) -> int:
     
     orchestrator = PipelineOrchestrator(storage_root=settings.storage_root)
     visualizer = TreeVisualizer(storage_root=settings.storage_root)
-    result = TestResult()
+    clients = build_conversation_clients(settings, fast=fast)
+    paths = SessionPaths.for_session(settings.storage_root, session_id)
+    result = TestResult(verbose=_VERBOSE)
     
     try:
         # Stage 1: Onboarding
-        await stage_1_onboarding(session_id, orchestrator, result)
+        await stage_1_onboarding(session_id, orchestrator, result, paths)
+        result.flush()
         
         # Stage 2: Root generation
         future_selves = await stage_2_root_generation(
-            session_id, orchestrator, visualizer, result
+            session_id, orchestrator, visualizer, result, paths
         )
+        result.flush()
         
         # Stage 3: Conversation (with first future self)
         target_self = future_selves[0]
-        await stage_3_conversation(session_id, target_self, orchestrator, result)
+        await stage_3_conversation(session_id, target_self, orchestrator, result, clients)
+        result.flush()
         
         # Stage 4: Secondary branching
-        child_selves = await stage_4_secondary_branching(
-            session_id, target_self, orchestrator, visualizer, result
+        child_selves, session_data = await stage_4_secondary_branching(
+            session_id, target_self, orchestrator, visualizer, result, paths
         )
+        result.flush()
         
         # Stage 5: Tree navigation
-        await stage_5_tree_navigation(session_id, visualizer, target_self, result)
+        await stage_5_tree_navigation(
+            session_id, visualizer, target_self, session_data, result
+        )
         
         # Print results
         result.print_summary()
@@ -657,7 +822,7 @@ async def run_full_pipeline_test(keep_session: bool = False) -> int:
         # Cleanup
         if not keep_session:
             import shutil
-            session_dir = Path(settings.storage_root) / session_id
+            session_dir = paths.session_dir
             if session_dir.exists():
                 shutil.rmtree(session_dir)
                 print(f"🧹 Cleaned up test session: {session_id}\n")
@@ -667,14 +832,14 @@ async def run_full_pipeline_test(keep_session: bool = False) -> int:
         return 0 if result.failed == 0 else 1
     
     except Exception as exc:
+        result.flush()
         print(f"\n❌ FATAL ERROR: {exc}")
         import traceback
         traceback.print_exc()
         return 1
 
 
-def main() -> int:
-    """Main entry point."""
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Full pipeline E2E test - validates complete workflow"
     )
@@ -683,10 +848,40 @@ def main() -> int:
         action="store_true",
         help="Keep test session after completion (don't clean up)"
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Use canned responses for the stage 3 conversation instead of Mistral"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Run under cProfile and print the slowest calls by cumulative time. "
+            "Work offloaded with asyncio.to_thread (LLM calls) shows up as time "
+            "spent waiting on the event loop."
+        )
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = build_parser().parse_args(argv)
+    test = run_full_pipeline_test(keep_session=args.keep_session, fast=args.fast)
+    if not args.profile:
+        return asyncio.run(test)
     
-    args = parser.parse_args()
+    import cProfile
+    import pstats
     
-    return asyncio.run(run_full_pipeline_test(keep_session=args.keep_session))
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return asyncio.run(test)
+    finally:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
 
 
 if __name__ == "__main__":
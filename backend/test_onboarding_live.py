@@ -6,7 +6,7 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -23,9 +23,8 @@ try:
 except Exception:
     pass
 
-from fastapi.testclient import TestClient
-
-from backend.app import app
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
 
 
 def _print_json(title: str, payload: dict[str, Any]) -> None:
@@ -60,55 +59,58 @@ def _reply_stream(client: TestClient, session_id: str, message: str) -> dict[str
     Use streaming endpoint (/interview/reply-stream) and collect all events.
     Returns aggregated response with full agent message and extraction results.
     """
-    resp = client.post(
-        "/interview/reply-stream",
-        json={"session_id": session_id, "user_message": message},
-        timeout=180,
-    )
-    if resp.status_code != 200:
-        raise RuntimeError(f"/interview/reply-stream failed ({resp.status_code}): {resp.text}")
-    
-    # Parse Server-Sent Events
-    agent_message = ""
+    # Parse Server-Sent Events line by line as the body is read
+    message_chunks: list[str] = []
     extraction_result = None
     error_msg = None
     
-    for line in resp.text.split("\n"):
-        if line.startswith("data: "):
+    with client.stream(
+        "POST",
+        "/interview/reply-stream",
+        json={"session_id": session_id, "user_message": message},
+        timeout=180,
+    ) as resp:
+        if resp.status_code != 200:
+            resp.read()
+            raise RuntimeError(f"/interview/reply-stream failed ({resp.status_code}): {resp.text}")
+        
+        for line in resp.iter_lines():
+            if not line.startswith("data: "):
+                continue
             data_str = line[6:]
             if not data_str or data_str == "[DONE]":
                 continue
             
             try:
                 event = json.loads(data_str)
-                event_type = event.get("type")
-                
-                if event_type == "chunk":
-                    agent_message += event.get("data", "")
-                    print(event.get("data", ""), end="", flush=True)
-                
-                elif event_type == "extraction":
-                    extraction_result = event.get("data", {})
-                
-                elif event_type == "extraction_timeout":
-                    print("\n[Note: Profile extraction taking longer than expected]", file=sys.stderr)
-                
-                elif event_type == "extraction_error":
-                    error_msg = event.get("data", "Unknown extraction error")
-                
-                elif event_type == "error":
-                    raise RuntimeError(f"Stream error: {event.get('data')}")
-                
-                elif event_type == "done":
-                    pass
-            
             except json.JSONDecodeError:
+                continue
+            event_type = event.get("type")
+            
+            if event_type == "chunk":
+                chunk = event.get("data", "")
+                message_chunks.append(chunk)
+                print(chunk, end="", flush=True)
+            
+            elif event_type == "extraction":
+                extraction_result = event.get("data", {})
+            
+            elif event_type == "extraction_timeout":
+                print("\n[Note: Profile extraction taking longer than expected]", file=sys.stderr)
+            
+            elif event_type == "extraction_error":
+                error_msg = event.get("data", "Unknown extraction error")
+            
+            elif event_type == "error":
+                raise RuntimeError(f"Stream error: {event.get('data')}")
+            
+            elif event_type == "done":
                 pass
     
     # Return in same format as non-streaming endpoint
     return {
         "session_id": session_id,
-        "agent_message": agent_message,
+        "agent_message": "".join(message_chunks),
         "profile_completeness": extraction_result.get("profile_completeness", 0.0) if extraction_result else 0.0,
         "extracted_fields": extraction_result.get("extracted_fields", {}) if extraction_result else {},
     }
@@ -471,17 +473,17 @@ def run_scripted(client: TestClient, session_id: str, user_name: str, use_stream
     print(f"Mode: {'STREAMING' if use_streaming else 'Standard'}")
     print(f"Agent: {started.get('agent_message', started.get('agentMessage', ''))}")
 
+    # Turns stay sequential: each reply updates the interview state the next one reads.
+    reply_fn = _reply_stream if use_streaming else _reply
     for idx, msg in enumerate(_default_messages(), start=1):
         print(f"\nYou ({idx}): {msg}")
         print("Agent: ", end="", flush=True)
-        reply_fn = _reply_stream if use_streaming else _reply
         r = reply_fn(client, session_id, msg)
         if use_streaming:
             print()  # Newline after streamed response
         else:
             print(r.get('agentMessage', r.get('agent_message', '')))
         print(f"Completeness: {r.get('profileCompleteness', r.get('profile_completeness', 0.0)):.2f}")
-        time.sleep(0.15)
 
     s = _status(client, session_id)
     _print_json("Onboarding Status Before Complete", s)
@@ -505,7 +507,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--session-id",
-        default=f"onboarding_live_{int(time.time())}",
+        default=f"onboarding_live_{time.time_ns() // 1_000_000}",
         help="Session id written under storage.",
     )
     parser.add_argument("--user-name", "--username", dest="user_name", default="User")
@@ -526,6 +528,12 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     args = build_parser().parse_args()
 
+    # Loading the app pulls in FastAPI, pydantic and the Mistral SDK; keep that
+    # off the --help / bad-argument path.
+    from fastapi.testclient import TestClient
+
+    from backend.app import app
+
     print("Running onboarding live test...")
     print("This uses real Mistral calls via your configured backend engines.")
     print("Single-file holistic flow: onboarding -> /complete -> auto exploration -> chat -> /branch")